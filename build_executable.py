@@ -20,13 +20,20 @@ Optional:
 from __future__ import annotations
 
 import argparse
+import fnmatch
+import hashlib
+import http.client
 import os
+import platform
 import shutil
 import stat
 import subprocess
 import sys
+import time
+import urllib.error
 import urllib.request
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
@@ -39,6 +46,28 @@ FFMPEG_ZIP_URL = "https://www.gyan.dev/ffmpeg/builds/ffmpeg-release-essentials.z
 
 # Preferred local location in the project (kept for both dev runs + builds)
 VENDORS_FFMPEG_BIN = Path("vendors") / "ffmpeg" / "bin"
+
+# Modules PyInstaller would otherwise pick up but the app never needs at runtime
+EXCLUDE_MODULES = (
+    "unittest", "test", "lib2to3", "idlelib", "tkinter.test",
+    "pip", "setuptools", "numpy", "matplotlib",
+)
+
+# FFmpeg files bundled into the EXE (shared builds ship the libav* DLLs next to the EXEs)
+FFMPEG_BUNDLE_EXES = ("ffmpeg.exe", "ffprobe.exe")
+FFMPEG_BUNDLE_DLLS = (
+    "avcodec-*.dll", "avformat-*.dll", "avutil-*.dll", "avfilter-*.dll", "avdevice-*.dll",
+    "swresample-*.dll", "swscale-*.dll", "postproc-*.dll",
+)
+
+# Release zip: files that are already compressed are stored, everything else deflated
+STORED_SUFFIXES = (".exe", ".dll", ".pyd", ".zip")
+
+# Chunk size for streaming downloads / archive members to disk
+IO_BUFSIZE = 1024 * 1024
+
+# Ask mirrors for the raw bytes (no transparent gzip on top of the zip)
+HTTP_HEADERS = {"Accept-Encoding": "identity", "User-Agent": "AudioConverter432/build"}
 # ------------------------
 
 
@@ -50,9 +79,9 @@ def _print(msg: str) -> None:
     print(msg, flush=True)
 
 
-def _run(cmd: list[str], cwd: Optional[Path] = None) -> None:
+def _run(cmd: list[str], cwd: Optional[Path] = None, env: Optional[dict[str, str]] = None) -> None:
     _print(">> " + " ".join(str(x) for x in cmd))
-    subprocess.check_call([str(x) for x in cmd], cwd=str(cwd) if cwd else None)
+    subprocess.check_call([str(x) for x in cmd], cwd=str(cwd) if cwd else None, env=env)
 
 
 def _on_rm_error(func, path, exc_info):
@@ -64,11 +93,66 @@ def _on_rm_error(func, path, exc_info):
         raise
 
 
-def _safe_rmtree(p: Path) -> None:
+def _is_link_entry(entry: os.DirEntry) -> bool:
+    """True for symlinks and Windows junctions/reparse points, which must never be descended into."""
+    if entry.is_symlink():
+        return True
+    is_junction = getattr(entry, "is_junction", None)  # Python 3.12+
+    if is_junction is not None and is_junction():
+        return True
+    attrs = getattr(entry.stat(follow_symlinks=False), "st_file_attributes", 0)  # Windows only
+    return bool(attrs & stat.FILE_ATTRIBUTE_REPARSE_POINT)
+
+
+def _remove_link(path: str) -> None:
+    """Remove the link itself, never its target (directory links on Windows need rmdir)."""
+    try:
+        os.unlink(path)
+    except OSError:
+        os.rmdir(path)
+
+
+def _fast_rmtree(path: str) -> None:
+    """Delete a directory tree using os.scandir; DirEntry type info saves a stat() per entry.
+
+    Like shutil.rmtree, links (symlinks, junctions) are removed without following them.
+    """
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False) or entry.is_symlink():
+                if _is_link_entry(entry):
+                    _remove_link(entry.path)
+                else:
+                    _fast_rmtree(entry.path)
+                continue
+            try:
+                os.unlink(entry.path)
+            except PermissionError:
+                _on_rm_error(os.unlink, entry.path, None)
+    try:
+        os.rmdir(path)
+    except PermissionError:
+        _on_rm_error(os.rmdir, path, None)
+
+
+def _safe_rmtree(p: Path, retries: int = 5) -> None:
     if not p.exists():
         return
     try:
-        shutil.rmtree(p, onerror=_on_rm_error)
+        if p.is_symlink():
+            p.unlink()
+            return
+        # Locks from antivirus / explorer are usually transient; back off briefly before giving up.
+        for attempt in range(retries):
+            try:
+                _fast_rmtree(str(p))
+                return
+            except OSError:
+                if not p.exists():
+                    return
+                if attempt == retries - 1:
+                    raise
+                time.sleep(0.2 * (1 << attempt))
     except Exception as e:
         # If something is locking it (e.g. antivirus / explorer), don't hard-fail.
         # Move it aside so the build can continue.
@@ -90,6 +174,9 @@ def _pip_install_requirements(project_dir: Path) -> None:
     We "combine requirements" by installing both files if present:
       - requirements.txt (runtime)
       - requirements-build.txt (build-only, e.g. pyinstaller)
+
+    Uses `uv pip` when uv is on PATH (parallel downloads); otherwise plain pip,
+    preferring wheels and skipping .pyc compilation.
     """
     req_files: list[Path] = []
     for name in ("requirements.txt", "requirements-build.txt"):
@@ -101,13 +188,40 @@ def _pip_install_requirements(project_dir: Path) -> None:
         _print("No requirements*.txt files found; skipping dependency install.")
         return
 
-    cmd = [sys.executable, "-m", "pip", "install", "--upgrade", "pip", "setuptools", "wheel"]
-    _run(cmd)
+    # Skip pip entirely when this interpreter already installed these exact requirements.
+    h = hashlib.sha256()
+    for rf in req_files:
+        h.update(rf.read_bytes())
+    h.update(sys.executable.encode("utf-8"))
+    h.update(platform.python_version().encode("utf-8"))
+    digest = h.hexdigest()
+    stamp = _cache_dir() / "deps.stamp"
+    try:
+        if stamp.read_text(encoding="utf-8").strip() == digest:
+            _print("Dependencies unchanged since last install; skipping pip.")
+            return
+    except OSError:
+        pass
 
-    cmd = [sys.executable, "-m", "pip", "install", "--upgrade"]
+    req_args: list[str] = []
     for rf in req_files:
-        cmd += ["-r", str(rf)]
-    _run(cmd)
+        req_args += ["-r", str(rf)]
+
+    uv = shutil.which("uv")
+    if uv:
+        _run([uv, "pip", "install", "--python", sys.executable, "--upgrade"] + req_args)
+    else:
+        # One pip run for the toolchain + requirements: a single startup and resolver pass.
+        env = dict(os.environ, PIP_NO_COMPILE="1")
+        cmd = [sys.executable, "-m", "pip", "install", "--upgrade", "--prefer-binary", "--no-compile",
+               "pip", "setuptools", "wheel"] + req_args
+        _run(cmd, env=env)
+
+    try:
+        stamp.parent.mkdir(parents=True, exist_ok=True)
+        stamp.write_text(digest, encoding="utf-8")
+    except OSError as e:
+        _print(f"WARNING: Could not write dependency stamp '{stamp}'. ({e})")
 
 
 def _ensure_pyinstaller(project_dir: Path, skip_pip: bool) -> None:
@@ -145,17 +259,21 @@ def _find_ffmpeg_bin(project_dir: Path) -> Optional[Path]:
 
     # 2) ffmpeg* folders
     try:
-        for item in project_dir.iterdir():
-            if not item.is_dir():
-                continue
-            if not item.name.lower().startswith("ffmpeg"):
-                continue
-            cand1 = item / "bin"
-            if (cand1 / ffmpeg_name).is_file() and (cand1 / ffprobe_name).is_file():
-                return cand1
-            cand2 = item
-            if (cand2 / ffmpeg_name).is_file() and (cand2 / ffprobe_name).is_file():
-                return cand2
+        with os.scandir(project_dir) as it:
+            for entry in it:
+                # Name check first: it's free, and DirEntry.is_dir() usually is too.
+                if not entry.name.lower().startswith("ffmpeg"):
+                    continue
+                if not entry.is_dir(follow_symlinks=False):
+                    continue
+                cand1 = os.path.join(entry.path, "bin")
+                if os.path.isfile(os.path.join(cand1, ffmpeg_name)) and \
+                        os.path.isfile(os.path.join(cand1, ffprobe_name)):
+                    return Path(cand1)
+                cand2 = entry.path
+                if os.path.isfile(os.path.join(cand2, ffmpeg_name)) and \
+                        os.path.isfile(os.path.join(cand2, ffprobe_name)):
+                    return Path(cand2)
     except Exception:
         pass
 
@@ -174,47 +292,158 @@ def _find_ffmpeg_bin(project_dir: Path) -> Optional[Path]:
     return None
 
 
+def _download_resumable(url: str, dest: Path, chunk: int = IO_BUFSIZE, retries: int = 5) -> None:
+    """Stream url into dest with large buffered writes, resuming via HTTP Range after a dropped connection.
+
+    An existing partial dest is continued rather than restarted. Connection errors, HTTP 429 and
+    5xx responses are retried with exponential backoff; other HTTP errors are raised at once.
+    Mirrors main._download_resumable (the build script does not import main.py); keep the two in sync.
+    """
+    for attempt in range(retries):
+        offset = dest.stat().st_size if dest.exists() else 0
+        headers = dict(HTTP_HEADERS)
+        if offset:
+            headers["Range"] = f"bytes={offset}-"
+        try:
+            with urllib.request.urlopen(urllib.request.Request(url, headers=headers)) as r:
+                if offset and r.status != 206:
+                    offset = 0  # server ignored the Range header: start over
+                expected = _expected_size(r, offset)
+                with open(dest, "ab" if offset else "wb", buffering=chunk) as f:
+                    shutil.copyfileobj(r, f, chunk)
+            if expected is not None and dest.stat().st_size < expected:
+                raise ConnectionError(f"connection closed at {dest.stat().st_size} of {expected} bytes")
+            return
+        except urllib.error.HTTPError as e:
+            if e.code == 416 and offset:
+                return  # nothing left to fetch: the partial file is already complete
+            if e.code != 429 and e.code < 500:
+                raise  # other 4xx: asking again won't help
+            error: Exception = e  # throttled / server-side trouble: back off like a dropped connection
+        except (urllib.error.URLError, http.client.HTTPException, OSError) as e:
+            error = e
+        if attempt == retries - 1:
+            raise error
+        delay = 2 ** attempt
+        _print(f"WARNING: Download interrupted ({error}); resuming in {delay}s...")
+        time.sleep(delay)
+
+
+def _expected_size(r, offset: int) -> Optional[int]:
+    """Total size of the resource from Content-Range (206) or Content-Length (200)."""
+    content_range = r.headers.get("Content-Range")
+    if content_range and "/" in content_range:
+        total = content_range.rsplit("/", 1)[1].strip()
+        return int(total) if total.isdigit() else None
+    length = r.headers.get("Content-Length")
+    return offset + int(length) if length and length.isdigit() else None
+
+
+def _cache_dir() -> Path:
+    """Per-user cache folder for build downloads (%LOCALAPPDATA%\\AudioConverter432 on Windows)."""
+    base = os.environ.get("LOCALAPPDATA") or os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(base) / "AudioConverter432"
+
+
+def _fetch_ffmpeg_zip() -> Path:
+    """Return a local copy of the FFmpeg archive, reusing the cached one while the server's ETag is unchanged.
+
+    The cache key is the ETag (or Last-Modified) from a HEAD request, so warm builds only
+    pay for a metadata round-trip instead of the full ~80 MB download.
+    """
+    cache_dir = _cache_dir()
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    validator: Optional[str] = None
+    try:
+        head = urllib.request.Request(FFMPEG_ZIP_URL, headers=HTTP_HEADERS, method="HEAD")
+        with urllib.request.urlopen(head) as r:
+            validator = r.headers.get("ETag") or r.headers.get("Last-Modified")
+    except Exception as e:
+        _print(f"WARNING: Could not query FFmpeg archive metadata ({e}); downloading without cache.")
+
+    if not validator:
+        zip_path = cache_dir / "ffmpeg-download.zip"
+        _print(f"Downloading FFmpeg: {FFMPEG_ZIP_URL}")
+        _print(f" -> {zip_path}")
+        # No validator to tell versions apart, so never resume a leftover file.
+        zip_path.unlink(missing_ok=True)
+        _download_resumable(FFMPEG_ZIP_URL, zip_path)
+        return zip_path
+
+    key = hashlib.sha256(validator.encode("utf-8")).hexdigest()[:16]
+    cached = cache_dir / f"ffmpeg-{key}.zip"
+    if cached.is_file():
+        _print(f"Using cached FFmpeg archive: {cached}")
+        return cached
+
+    _print(f"Downloading FFmpeg: {FFMPEG_ZIP_URL}")
+    _print(f" -> {cached}")
+    # The .part name is tied to the ETag, so an interrupted build resumes the same file.
+    part = cached.with_name(cached.name + ".part")
+    _download_resumable(FFMPEG_ZIP_URL, part)
+    os.replace(part, cached)
+    # Drop archives cached under an older ETag.
+    for old in cache_dir.glob("ffmpeg-*.zip"):
+        if old != cached:
+            try:
+                old.unlink()
+            except OSError:
+                pass
+    return cached
+
+
+def _ffmpeg_bin_prefix(names: list[str]) -> Optional[str]:
+    """Return the archive folder (e.g. 'ffmpeg-7.1-essentials_build/bin/') holding ffmpeg.exe + ffprobe.exe.
+
+    Prefers a .../bin/ folder, like the unpacked-build layouts handled by _find_ffmpeg_bin.
+    """
+    lowered = {n.lower() for n in names}
+    found: Optional[str] = None
+    for n in names:
+        if not n.lower().endswith("ffmpeg.exe"):
+            continue
+        prefix = n[: -len("ffmpeg.exe")]
+        if prefix and not prefix.endswith("/"):
+            continue
+        if (prefix + "ffprobe.exe").lower() not in lowered:
+            continue
+        if prefix.lower().endswith("bin/"):
+            return prefix
+        if found is None:
+            found = prefix
+    return found
+
+
 def _download_ffmpeg_to_vendors(project_dir: Path) -> Path:
     """Download FFmpeg zip and populate ./vendors/ffmpeg/bin with ffmpeg.exe, ffprobe.exe, and DLLs."""
     vendors_bin = project_dir / VENDORS_FFMPEG_BIN
     vendors_bin.mkdir(parents=True, exist_ok=True)
 
-    tmp = project_dir / "vendors" / "_ffmpeg_tmp"
-    _safe_rmtree(tmp)
-    tmp.mkdir(parents=True, exist_ok=True)
-
-    zip_path = tmp / "ffmpeg.zip"
-    _print(f"Downloading FFmpeg: {FFMPEG_ZIP_URL}")
-    _print(f" -> {zip_path}")
-    urllib.request.urlretrieve(FFMPEG_ZIP_URL, zip_path)
+    zip_path = _fetch_ffmpeg_zip()
 
     _print("Extracting FFmpeg...")
     with zipfile.ZipFile(zip_path, "r") as z:
-        z.extractall(tmp)
-
-    # Find extracted bin folder
-    bin_dir: Optional[Path] = None
-    for root, _, files in os.walk(tmp):
-        if "ffmpeg.exe" in files and "ffprobe.exe" in files:
-            r = Path(root)
-            # Prefer a .../bin folder
-            if r.name.lower() == "bin":
-                bin_dir = r
-                break
-            if bin_dir is None:
-                bin_dir = r
-
-    if not bin_dir:
-        raise RuntimeError(
-            "FFmpeg download/extract succeeded, but ffmpeg.exe/ffprobe.exe were not found in the archive."
-        )
-
-    _print(f"Copying FFmpeg files into: {vendors_bin}")
-    for f in bin_dir.iterdir():
-        if f.is_file():
-            shutil.copy2(f, vendors_bin / f.name)
-
-    _safe_rmtree(tmp)
+        infos = z.infolist()
+
+        # Locate the folder holding ffmpeg.exe + ffprobe.exe from the archive listing
+        # (no need to extract docs/presets just to find it).
+        prefix = _ffmpeg_bin_prefix([info.filename for info in infos])
+        if prefix is None:
+            raise RuntimeError(
+                "FFmpeg download succeeded, but ffmpeg.exe/ffprobe.exe were not found in the archive."
+            )
+
+        # Stream only the binaries straight into vendors/ffmpeg/bin.
+        _print(f"Extracting FFmpeg files into: {vendors_bin}")
+        for info in infos:
+            if info.is_dir() or not info.filename.startswith(prefix):
+                continue
+            name = info.filename[len(prefix):]
+            if "/" in name or not name.lower().endswith((".exe", ".dll")):
+                continue
+            with z.open(info) as src, open(vendors_bin / name, "wb") as dst:
+                shutil.copyfileobj(src, dst, IO_BUFSIZE)
+
     return vendors_bin
 
 
@@ -233,12 +462,13 @@ def _bundle_ffmpeg_args(ffmpeg_bin: Path) -> list[str]:
     args: list[str] = []
     dest = "vendors/ffmpeg/bin"
 
-    # Only bundle what FFmpeg needs at runtime: .exe + .dll
+    # Only bundle what main.py launches (ffmpeg + ffprobe) and the FFmpeg libraries
+    # they link against; ffplay.exe and unrelated DLLs would only bloat the EXE.
     for f in ffmpeg_bin.iterdir():
         if not f.is_file():
             continue
-        ext = f.suffix.lower()
-        if ext in (".exe", ".dll"):
+        name = f.name.lower()
+        if name in FFMPEG_BUNDLE_EXES or any(fnmatch.fnmatch(name, pat) for pat in FFMPEG_BUNDLE_DLLS):
             spec = f"{str(f)}{os.pathsep}{dest}"
             args.append(f"--add-binary={spec}")
 
@@ -251,7 +481,9 @@ def _zip_release(dist_dir: Path, exe_name: str) -> Path:
     if zip_path.exists():
         zip_path.unlink()
 
-    with zipfile.ZipFile(zip_path, "w", compression=zipfile.ZIP_DEFLATED) as z:
+    # The one-file EXE (and the binaries in a onedir build) are already compressed;
+    # deflating them again costs CPU for ~no size gain, so they are stored as-is.
+    with zipfile.ZipFile(zip_path, "w", compression=zipfile.ZIP_STORED) as z:
         exe_file = dist_dir / f"{exe_name}.exe"
         if exe_file.is_file():
             z.write(exe_file, arcname=exe_file.name)
@@ -261,12 +493,29 @@ def _zip_release(dist_dir: Path, exe_name: str) -> Path:
             if not app_dir.is_dir():
                 raise RuntimeError("Nothing to zip: expected dist exe or dist/<name>/ folder.")
             for p in app_dir.rglob("*"):
-                if p.is_file():
+                if not p.is_file():
+                    continue
+                if p.suffix.lower() in STORED_SUFFIXES:
                     z.write(p, arcname=str(p.relative_to(dist_dir)))
+                else:
+                    z.write(p, arcname=str(p.relative_to(dist_dir)),
+                            compress_type=zipfile.ZIP_DEFLATED, compresslevel=1)
 
     return zip_path
 
 
+def _build_cache_key(project_dir: Path, main_script: Path, pyi_args: list[str]) -> str:
+    """Fingerprint of the inputs that invalidate PyInstaller's build/ cache and the generated .spec."""
+    h = hashlib.sha256()
+    h.update(str(main_script.stat().st_mtime_ns).encode("utf-8"))
+    for name in ("requirements.txt", "requirements-build.txt"):
+        p = project_dir / name
+        if p.is_file():
+            h.update(p.read_bytes())
+    h.update("\0".join(pyi_args).encode("utf-8"))
+    return h.hexdigest()
+
+
 def create_executable(
     *,
     onefile: bool = True,
@@ -292,22 +541,8 @@ def create_executable(
     _ensure_pyinstaller(project_dir, skip_pip=skip_pip)
     import PyInstaller.__main__  # noqa: F401
 
-    # Clean old outputs
-    if clean:
-        _print("\n[1/4] Cleaning previous build artifacts...")
-        _safe_rmtree(project_dir / "build")
-        _safe_rmtree(project_dir / "dist")
-        spec_file = project_dir / f"{EXE_NAME}.spec"
-        if spec_file.exists():
-            try:
-                spec_file.unlink()
-            except Exception:
-                _print(f"WARNING: Could not delete spec file: {spec_file}")
-    else:
-        _print("\n[1/4] Clean skipped (as requested).")
-
     # Locate/download ffmpeg
-    _print("\n[2/4] Locating FFmpeg...")
+    _print("\n[1/4] Locating FFmpeg...")
     ffmpeg_bin = _find_ffmpeg_bin(project_dir)
     if not ffmpeg_bin and download_ffmpeg and _is_windows():
         _print("FFmpeg not found locally. Auto-downloading into ./vendors/ffmpeg/bin ...")
@@ -319,16 +554,17 @@ def create_executable(
         ffmpeg_bin = None
 
     # Build PyInstaller args (IMPORTANT: options first, script LAST)
-    _print("\n[3/4] Running PyInstaller...")
     args: list[str] = [
         "--noconfirm",
-        "--clean",
         "--windowed",
         f"--name={EXE_NAME}",
+        f"--specpath={project_dir}",
         # Ensure tkinterdnd2 (TkDND) binary/data gets included for drag-and-drop:
         "--collect-all=tkinterdnd2",
         "--hidden-import=tkinterdnd2",
     ]
+    # Keep dev-only / unused modules out of the bundle (smaller EXE, faster one-file extraction).
+    args += [f"--exclude-module={m}" for m in EXCLUDE_MODULES]
     if onefile:
         args.append("--onefile")
     else:
@@ -341,12 +577,49 @@ def create_executable(
     # Finally: the entry script
     args.append(str(main_script))
 
+    # build/ and the generated .spec are only reused while script, requirements and args are unchanged.
+    key_file = project_dir / "build" / ".pyi-key"
+    spec_file = project_dir / f"{EXE_NAME}.spec"
+    build_key = _build_cache_key(project_dir, main_script, args)
+    try:
+        cache_hit = key_file.read_text(encoding="utf-8").strip() == build_key
+    except OSError:
+        cache_hit = False
+
+    # Clean old outputs
+    if clean and cache_hit:
+        _print("\n[2/4] Cleaning dist/ (keeping build/ cache and .spec: inputs unchanged)...")
+        _safe_rmtree(project_dir / "dist")
+    elif clean:
+        _print("\n[2/4] Cleaning previous build artifacts...")
+        # Both trees hold thousands of small files; delete them concurrently.
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            futures = [pool.submit(_safe_rmtree, project_dir / d) for d in ("build", "dist")]
+            for fut in futures:
+                fut.result()
+        if spec_file.exists():
+            try:
+                spec_file.unlink()
+            except Exception:
+                _print(f"WARNING: Could not delete spec file: {spec_file}")
+    else:
+        _print("\n[2/4] Clean skipped (as requested).")
+
+    _print("\n[3/4] Running PyInstaller...")
+    if cache_hit and spec_file.is_file():
+        # The .spec written by the previous identical build is authoritative; skip the CLI translation.
+        pyi_args = ["--noconfirm", str(spec_file)]
+    elif cache_hit:
+        pyi_args = args
+    else:
+        pyi_args = args[:-1] + ["--clean", args[-1]]
+
     _print("PyInstaller args:")
-    _print("pyinstaller " + " ".join(args))
+    _print("pyinstaller " + " ".join(pyi_args))
 
     # Execute build
     import PyInstaller.__main__  # noqa
-    PyInstaller.__main__.run(args)
+    PyInstaller.__main__.run(pyi_args)
 
     # Verify output
     _print("\n[4/4] Verifying output...")
@@ -368,6 +641,11 @@ def create_executable(
         else:
             raise RuntimeError("Build finished but executable was not found in dist/. Check PyInstaller output above.")
 
+    try:
+        key_file.write_text(build_key, encoding="utf-8")
+    except OSError as e:
+        _print(f"WARNING: Could not write build cache key '{key_file}'. ({e})")
+
     if make_zip:
         zip_path = _zip_release(dist_dir, EXE_NAME)
         _print(f"📦 Release zip created: {zip_path.resolve()}")
@@ -1,22 +1,33 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import os
+import queue
 import re
 import subprocess
 import shutil
 import sys
 import threading
-import unittest
+from collections import deque
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Tuple, \
+from typing import Callable, Iterable, Iterator, List, NamedTuple, Optional, Tuple, \
     Union  # Union might be needed for PopenResult type hints for older Pythons, but | is fine for 3.10+
 import logging
+import logging.handlers
+import atexit
 import json  # Added for parsing ffprobe JSON output
-import zipfile
-import tempfile
 import time
-import urllib.request
+try:
+    from orjson import loads as _json_loads  # optional, much faster for the per-file ffprobe JSON
+except ImportError:
+    _json_loads = json.loads
+try:
+    import sqlite3
+except ImportError:  # Some embedded Python builds ship without _sqlite3
+    sqlite3 = None
 
 # =============================================================================
 # 0.  FFmpeg resolver
@@ -24,6 +35,13 @@ import urllib.request
 _FFMPEG = "ffmpeg"
 _FFPROBE = "ffprobe"
 
+# Directory of main.py in script mode (cwd if __file__ is unavailable); resolved once at import.
+_PROJECT_ROOT = Path(__file__).resolve().parent if "__file__" in globals() else Path.cwd()
+
+# Per-user state (resolved FFmpeg paths survive between launches)
+_APP_DATA_DIR = Path.home() / ".audioconverter432"
+_FFMPEG_MANIFEST = _APP_DATA_DIR / "ffmpeg.json"
+
 
 # Logging setup function
 def _setup_logging():
@@ -32,33 +50,92 @@ def _setup_logging():
         if getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS'):
             log_file_path = Path(sys.executable).parent / log_file_name
         else:
-            log_file_path = Path(__file__).resolve().parent / log_file_name
+            log_file_path = _PROJECT_ROOT / log_file_name
     except Exception:  # Fallback if path resolution fails for some reason
         log_file_path = Path(log_file_name)
 
-    logging.basicConfig(
-        filename=str(log_file_path),
-        level=logging.INFO,
-        format="%(asctime)s - %(levelname)s - %(module)s - %(funcName)s - %(lineno)d - %(message)s",
-        filemode='a'
-    )
+    file_handler = logging.FileHandler(str(log_file_path), mode='a')
+    file_handler.setFormatter(logging.Formatter(
+        "%(asctime)s - %(levelname)s - %(module)s - %(funcName)s - %(lineno)d - %(message)s"
+    ))
 
     console_handler = logging.StreamHandler(sys.stderr)
     console_handler.setLevel(logging.WARNING)
     formatter = logging.Formatter('%(levelname)s: %(message)s')
     console_handler.setFormatter(formatter)
-    logging.getLogger().addHandler(console_handler)
+
+    # Callers (worker threads included) only enqueue records; one listener thread does the
+    # formatting and the file/stderr writes. Stopped at exit so queued records are flushed.
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    listener.start()
+    atexit.register(listener.stop)
 
     logging.info("Application logging initialized.")
     logging.info(f"Initial FFmpeg path: {_FFMPEG}, FFprobe path: {_FFPROBE}")
 
 
 
+def _download_resumable(url: str, dest: Path, chunk: int = 1024 * 1024, retries: int = 5) -> None:
+    """Stream url into dest with large buffered writes, resuming via HTTP Range after a dropped connection.
+
+    Connection errors, HTTP 429 and 5xx responses are retried with exponential backoff; other HTTP
+    errors are raised at once. build_executable.py has its own copy (it does not import main.py);
+    keep the two in sync.
+    """
+    # Deferred imports: only the auto-download path needs the HTTP stack.
+    import http.client
+    import urllib.error
+    import urllib.request
+
+    for attempt in range(retries):
+        offset = dest.stat().st_size if dest.exists() else 0
+        headers = {"Accept-Encoding": "identity", "User-Agent": "AudioConverter432"}
+        if offset:
+            headers["Range"] = f"bytes={offset}-"
+        try:
+            with urllib.request.urlopen(urllib.request.Request(url, headers=headers)) as resp:  # nosec - expected download
+                if offset and resp.status != 206:
+                    offset = 0  # server ignored the Range header: start over
+                # Total size from Content-Range (206) or Content-Length (200), if the server sent it.
+                expected: Optional[int] = None
+                content_range = resp.headers.get("Content-Range") or ""
+                content_length = resp.headers.get("Content-Length") or ""
+                if "/" in content_range and content_range.rsplit("/", 1)[1].strip().isdigit():
+                    expected = int(content_range.rsplit("/", 1)[1])
+                elif content_length.isdigit():
+                    expected = offset + int(content_length)
+                with open(dest, "ab" if offset else "wb", buffering=chunk) as f:
+                    shutil.copyfileobj(resp, f, chunk)
+            if expected is not None and dest.stat().st_size < expected:
+                raise ConnectionError(f"connection closed at {dest.stat().st_size} of {expected} bytes")
+            return
+        except urllib.error.HTTPError as e:
+            if e.code == 416 and offset:
+                return  # the partial file is already complete
+            if e.code != 429 and e.code < 500:
+                raise  # other 4xx: asking again won't help
+            error: Exception = e  # throttled / server-side trouble: back off like a dropped connection
+        except (urllib.error.URLError, http.client.HTTPException, OSError) as e:
+            error = e
+        if attempt == retries - 1:
+            raise error
+        logging.warning(f"Download interrupted ({error}); resuming in {2 ** attempt}s...")
+        time.sleep(2 ** attempt)
+
+
 def _download_ffmpeg_windows(dest_bin_dir: Path) -> Tuple[Optional[Path], Optional[Path]]:
     """Download a known-good FFmpeg build on Windows into dest_bin_dir.
 
     This keeps the project portable (no global install required).
     """
+    # Deferred imports: normal launches never download anything.
+    import tempfile
+    import zipfile
+
     try:
         dest_bin_dir.mkdir(parents=True, exist_ok=True)
         ffmpeg_exe = dest_bin_dir / "ffmpeg.exe"
@@ -72,24 +149,20 @@ def _download_ffmpeg_windows(dest_bin_dir: Path) -> Tuple[Optional[Path], Option
         with tempfile.TemporaryDirectory() as td:
             td_path = Path(td)
             zip_path = td_path / "ffmpeg.zip"
-            urllib.request.urlretrieve(url, zip_path)  # nosec - expected download
+            _download_resumable(url, zip_path)
             with zipfile.ZipFile(zip_path, "r") as zf:
-                zf.extractall(td_path)
-
-            # Find extracted ffmpeg*/bin
-            bin_dir: Optional[Path] = None
-            for p in td_path.iterdir():
-                if p.is_dir() and p.name.lower().startswith("ffmpeg"):
-                    cand = p / "bin"
-                    if (cand / "ffmpeg.exe").is_file() and (cand / "ffprobe.exe").is_file():
-                        bin_dir = cand
-                        break
-            if not bin_dir:
-                logging.error("Auto-download succeeded but could not locate ffmpeg.exe/ffprobe.exe inside the zip.")
-                return None, None
-
-            shutil.copy2(bin_dir / "ffmpeg.exe", ffmpeg_exe)
-            shutil.copy2(bin_dir / "ffprobe.exe", ffprobe_exe)
+                # Find ffmpeg*/bin from the archive listing; only the two EXEs are unpacked.
+                names = zf.namelist()
+                bin_prefix = next((n[:-len("ffmpeg.exe")] for n in names if n.lower().endswith("/bin/ffmpeg.exe")), None)
+                if bin_prefix is None or (bin_prefix + "ffprobe.exe") not in names:
+                    logging.error("Auto-download succeeded but could not locate ffmpeg.exe/ffprobe.exe inside the zip.")
+                    return None, None
+
+                for member, dest in ((bin_prefix + "ffmpeg.exe", ffmpeg_exe), (bin_prefix + "ffprobe.exe", ffprobe_exe)):
+                    part = dest.with_name(dest.name + ".part")
+                    with zf.open(member) as src, open(part, "wb") as dst:
+                        shutil.copyfileobj(src, dst, 1024 * 1024)
+                    os.replace(part, dest)
 
         logging.warning(f"Auto-downloaded FFmpeg into: {dest_bin_dir}")
         return ffmpeg_exe, ffprobe_exe
@@ -98,9 +171,50 @@ def _download_ffmpeg_windows(dest_bin_dir: Path) -> Tuple[Optional[Path], Option
         return None, None
 
 
+def _load_ffmpeg_manifest() -> Optional[Tuple[str, str]]:
+    """Return the (ffmpeg, ffprobe) paths saved by a previous launch if both files are unchanged."""
+    try:
+        data = json.loads(_FFMPEG_MANIFEST.read_text(encoding="utf-8"))
+        paths = []
+        for key in ("ffmpeg", "ffprobe"):
+            entry = data[key]
+            st = os.stat(entry["path"])
+            if st.st_size != entry["size"] or st.st_mtime_ns != entry["mtime_ns"]:
+                return None
+            paths.append(entry["path"])
+        return paths[0], paths[1]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _save_ffmpeg_manifest(ffmpeg_path: str, ffprobe_path: str) -> None:
+    """Remember resolved FFmpeg paths (with size/mtime for validation) for the next launch."""
+    # A one-file EXE unpacks into a fresh _MEIPASS dir per launch; those paths never survive.
+    meipass = getattr(sys, '_MEIPASS', None)
+    if meipass and ffmpeg_path.startswith(str(meipass)):
+        return
+    try:
+        data = {}
+        for key, path in (("ffmpeg", ffmpeg_path), ("ffprobe", ffprobe_path)):
+            st = os.stat(path)
+            data[key] = {"path": path, "size": st.st_size, "mtime_ns": st.st_mtime_ns}
+        _APP_DATA_DIR.mkdir(parents=True, exist_ok=True)
+        _FFMPEG_MANIFEST.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    except OSError as e:
+        logging.info(f"Could not write FFmpeg manifest {_FFMPEG_MANIFEST}: {e}")
+
+
 def _resolve_ffmpeg(ffmpeg_arg: Optional[Path | str]) -> None:
     global _FFMPEG, _FFPROBE
-    logging.info(f"Attempting to resolve FFmpeg. Argument provided: {ffmpeg_arg}")
+    logging.info("Attempting to resolve FFmpeg. Argument provided: %s", ffmpeg_arg)
+
+    # Fast path: reuse the previous launch's result while the binaries are unchanged.
+    if not ffmpeg_arg:
+        cached = _load_ffmpeg_manifest()
+        if cached:
+            _FFMPEG, _FFPROBE = cached
+            logging.info("FFmpeg resolved from manifest %s: %s, %s", _FFMPEG_MANIFEST, _FFMPEG, _FFPROBE)
+            return
 
     ffmpeg_exe_name = "ffmpeg.exe" if os.name == "nt" else "ffmpeg"
     ffprobe_exe_name = "ffprobe.exe" if os.name == "nt" else "ffprobe"
@@ -110,7 +224,7 @@ def _resolve_ffmpeg(ffmpeg_arg: Optional[Path | str]) -> None:
     source_of_resolution = "default"
 
     if ffmpeg_arg:
-        logging.info(f"Checking --ffmpeg argument: {ffmpeg_arg}")
+        logging.info("Checking --ffmpeg argument: %s", ffmpeg_arg)
         p_arg = Path(ffmpeg_arg).expanduser().resolve()
         temp_ffmpeg: Optional[Path] = None
         temp_ffprobe: Optional[Path] = None
@@ -119,20 +233,20 @@ def _resolve_ffmpeg(ffmpeg_arg: Optional[Path | str]) -> None:
             temp_ffmpeg = p_arg
             temp_ffprobe = p_arg.with_name(
                 ffprobe_exe_name.split('.')[0] + p_arg.suffix)
-            logging.info(f"Argument is a file. ffmpeg: {temp_ffmpeg}, ffprobe guess: {temp_ffprobe}")
+            logging.info("Argument is a file. ffmpeg: %s, ffprobe guess: %s", temp_ffmpeg, temp_ffprobe)
         elif p_arg.is_dir():
             temp_ffmpeg = p_arg / ffmpeg_exe_name
             temp_ffprobe = p_arg / ffprobe_exe_name
-            logging.info(f"Argument is a directory. ffmpeg: {temp_ffmpeg}, ffprobe: {temp_ffprobe}")
+            logging.info("Argument is a directory. ffmpeg: %s, ffprobe: %s", temp_ffmpeg, temp_ffprobe)
 
         if temp_ffmpeg and temp_ffmpeg.is_file() and \
                 temp_ffprobe and temp_ffprobe.is_file():
-            resolved_ffmpeg_path = str(temp_ffmpeg.resolve())
-            resolved_ffprobe_path = str(temp_ffprobe.resolve())
+            resolved_ffmpeg_path = str(temp_ffmpeg)
+            resolved_ffprobe_path = str(temp_ffprobe)
             source_of_resolution = f"argument '{ffmpeg_arg}'"
-            logging.info(f"Resolved from argument: ffmpeg='{resolved_ffmpeg_path}', ffprobe='{resolved_ffprobe_path}'")
+            logging.info("Resolved from argument: ffmpeg='%s', ffprobe='%s'", resolved_ffmpeg_path, resolved_ffprobe_path)
         else:
-            logging.warning(f"Could not resolve ffmpeg/ffprobe from argument path: {ffmpeg_arg}")
+            logging.warning("Could not resolve ffmpeg/ffprobe from argument path: %s", ffmpeg_arg)
 
     if not resolved_ffmpeg_path:
         logging.info("Checking System PATH for ffmpeg/ffprobe.")
@@ -142,8 +256,7 @@ def _resolve_ffmpeg(ffmpeg_arg: Optional[Path | str]) -> None:
             resolved_ffmpeg_path = path_ffmpeg
             resolved_ffprobe_path = path_ffprobe
             source_of_resolution = "System PATH"
-            logging.info(
-                f"Resolved from System PATH: ffmpeg='{resolved_ffmpeg_path}', ffprobe='{resolved_ffprobe_path}'")
+            logging.info("Resolved from System PATH: ffmpeg='%s', ffprobe='%s'", resolved_ffmpeg_path, resolved_ffprobe_path)
         else:
             logging.info("Not found in System PATH.")
 
@@ -158,13 +271,11 @@ def _resolve_ffmpeg(ffmpeg_arg: Optional[Path | str]) -> None:
             bundle_root = Path(sys._MEIPASS)
             exe_root = Path(sys.executable).resolve().parent
             search_roots = [bundle_root, exe_root]
-            logging.info(f"Application is frozen. bundle_root={bundle_root}, exe_root={exe_root}")
+            logging.info("Application is frozen. bundle_root=%s, exe_root=%s", bundle_root, exe_root)
         else:
-            try:
-                script_root = Path(__file__).resolve().parent
-            except NameError:  # if __file__ is not defined (e.g. interactive session)
-                script_root = Path.cwd()
-                logging.warning(f"__file__ not defined, using current working directory for bundled search: {script_root}")
+            script_root = _PROJECT_ROOT
+            if "__file__" not in globals():  # e.g. interactive session
+                logging.warning("__file__ not defined, using current working directory for bundled search: %s", script_root)
             search_roots = [script_root]
 
         # 1) Prefer project-local portable FFmpeg if present: ./vendors/ffmpeg/bin/{ffmpeg,ffprobe}.exe
@@ -172,11 +283,11 @@ def _resolve_ffmpeg(ffmpeg_arg: Optional[Path | str]) -> None:
             vendors_bin = root / "vendors" / "ffmpeg" / "bin"
             vend_ffmpeg = vendors_bin / ffmpeg_exe_name
             vend_ffprobe = vendors_bin / ffprobe_exe_name
-            logging.info(f"Checking vendors FFmpeg under: {vendors_bin}")
+            logging.info("Checking vendors FFmpeg under: %s", vendors_bin)
             if vend_ffmpeg.is_file() and vend_ffprobe.is_file():
-                resolved_ffmpeg_path = str(vend_ffmpeg.resolve())
-                resolved_ffprobe_path = str(vend_ffprobe.resolve())
-                logging.info(f"Resolved from vendors/ffmpeg/bin under: {root}")
+                resolved_ffmpeg_path = str(vend_ffmpeg)
+                resolved_ffprobe_path = str(vend_ffprobe)
+                logging.info("Resolved from vendors/ffmpeg/bin under: %s", root)
                 break
 
         # 2) If missing on Windows, try auto-download into a writable vendors folder (script dir or EXE dir).
@@ -185,20 +296,20 @@ def _resolve_ffmpeg(ffmpeg_arg: Optional[Path | str]) -> None:
             vendors_bin = dest_root / "vendors" / "ffmpeg" / "bin"
             dl_ffmpeg, dl_ffprobe = _download_ffmpeg_windows(vendors_bin)
             if dl_ffmpeg and dl_ffprobe and dl_ffmpeg.is_file() and dl_ffprobe.is_file():
-                resolved_ffmpeg_path = str(dl_ffmpeg.resolve())
-                resolved_ffprobe_path = str(dl_ffprobe.resolve())
-                logging.info(f"Resolved after auto-download into: {vendors_bin}")
+                resolved_ffmpeg_path = str(dl_ffmpeg)
+                resolved_ffprobe_path = str(dl_ffprobe)
+                logging.info("Resolved after auto-download into: %s", vendors_bin)
 
         # 3) Check next to script/executable root(s): ./ffmpeg(.exe), ./ffprobe(.exe)
         if not resolved_ffmpeg_path:
             for root in search_roots:
                 script_dir_ffmpeg = root / ffmpeg_exe_name
                 script_dir_ffprobe = root / ffprobe_exe_name
-                logging.info(f"Checking next to root: ffmpeg='{script_dir_ffmpeg}', ffprobe='{script_dir_ffprobe}'")
+                logging.info("Checking next to root: ffmpeg='%s', ffprobe='%s'", script_dir_ffmpeg, script_dir_ffprobe)
                 if script_dir_ffmpeg.is_file() and script_dir_ffprobe.is_file():
-                    resolved_ffmpeg_path = str(script_dir_ffmpeg.resolve())
-                    resolved_ffprobe_path = str(script_dir_ffprobe.resolve())
-                    logging.info(f"Resolved from root directory: {root}")
+                    resolved_ffmpeg_path = str(script_dir_ffmpeg)
+                    resolved_ffprobe_path = str(script_dir_ffprobe)
+                    logging.info("Resolved from root directory: %s", root)
                     break
 
         # 4) Check subdirectories named ffmpeg*: ./ffmpeg-xyz/bin/ffmpeg(.exe)
@@ -206,42 +317,47 @@ def _resolve_ffmpeg(ffmpeg_arg: Optional[Path | str]) -> None:
             logging.info("Checking 'ffmpeg*' subdirectories for ffmpeg/ffprobe.")
             for root in search_roots:
                 try:
-                    for item in root.iterdir():
-                        if item.is_dir() and item.name.lower().startswith("ffmpeg"):
-                            bin_dir_ffmpeg = item / "bin" / ffmpeg_exe_name
-                            bin_dir_ffprobe = item / "bin" / ffprobe_exe_name
-                            root_dir_ffmpeg = item / ffmpeg_exe_name
-                            root_dir_ffprobe = item / ffprobe_exe_name
-
-                            if bin_dir_ffmpeg.is_file() and bin_dir_ffprobe.is_file():
-                                resolved_ffmpeg_path = str(bin_dir_ffmpeg.resolve())
-                                resolved_ffprobe_path = str(bin_dir_ffprobe.resolve())
-                                logging.info(f"Resolved from subdirectory bin: {item}")
+                    with os.scandir(root) as it:
+                        for entry in it:
+                            if not entry.name.lower().startswith("ffmpeg") or not entry.is_dir():
+                                continue
+                            bin_dir = os.path.join(entry.path, "bin")
+                            bin_dir_ffmpeg = os.path.join(bin_dir, ffmpeg_exe_name)
+                            bin_dir_ffprobe = os.path.join(bin_dir, ffprobe_exe_name)
+                            root_dir_ffmpeg = os.path.join(entry.path, ffmpeg_exe_name)
+                            root_dir_ffprobe = os.path.join(entry.path, ffprobe_exe_name)
+
+                            if os.path.isfile(bin_dir_ffmpeg) and os.path.isfile(bin_dir_ffprobe):
+                                resolved_ffmpeg_path = bin_dir_ffmpeg
+                                resolved_ffprobe_path = bin_dir_ffprobe
+                                logging.info("Resolved from subdirectory bin: %s", entry.path)
                                 break
-                            if root_dir_ffmpeg.is_file() and root_dir_ffprobe.is_file():
-                                resolved_ffmpeg_path = str(root_dir_ffmpeg.resolve())
-                                resolved_ffprobe_path = str(root_dir_ffprobe.resolve())
-                                logging.info(f"Resolved from subdirectory root: {item}")
+                            if os.path.isfile(root_dir_ffmpeg) and os.path.isfile(root_dir_ffprobe):
+                                resolved_ffmpeg_path = root_dir_ffmpeg
+                                resolved_ffprobe_path = root_dir_ffprobe
+                                logging.info("Resolved from subdirectory root: %s", entry.path)
                                 break
                     if resolved_ffmpeg_path:
                         break
                 except Exception as e:
-                    logging.info(f"Skipping subdir scan under {root}: {e}")
+                    logging.info("Skipping subdir scan under %s: %s", root, e)
 
     if resolved_ffmpeg_path and resolved_ffprobe_path:
         _FFMPEG = resolved_ffmpeg_path
         _FFPROBE = resolved_ffprobe_path
-        logging.info(f"FFmpeg resolved to: {_FFMPEG}")
-        logging.info(f"FFprobe resolved to: {_FFPROBE}")
+        logging.info("FFmpeg resolved to: %s", _FFMPEG)
+        logging.info("FFprobe resolved to: %s", _FFPROBE)
     else:
-        logging.warning(f"Could not resolve ffmpeg/ffprobe using any method. Using defaults: {_FFMPEG}, {_FFPROBE}")
+        logging.warning("Could not resolve ffmpeg/ffprobe using any method. Using defaults: %s, %s", _FFMPEG, _FFPROBE)
 
-    final_ffmpeg_executable = shutil.which(_FFMPEG)
+    # Resolved paths are already absolute; only fall back to a PATH/PATHEXT walk for bare names.
+    final_ffmpeg_executable = _FFMPEG if (os.path.isabs(_FFMPEG) and os.access(_FFMPEG, os.X_OK)) \
+        else shutil.which(_FFMPEG)
     if not final_ffmpeg_executable:
         search_locations_tried = [
             f"  - Argument --ffmpeg: {ffmpeg_arg if ffmpeg_arg else 'not provided (or path invalid)'}",
             f"  - System PATH for '{ffmpeg_exe_name}'",
-            f"  - Next to script: {Path(__file__).resolve().parent / ffmpeg_exe_name if '__file__' in globals() else 'N/A (interactive?)'}",
+            f"  - Next to script: {_PROJECT_ROOT / ffmpeg_exe_name}",
             "  - In 'ffmpeg*' subdirectories (e.g., ./ffmpeg-xyz/ffmpeg.exe or ./ffmpeg-xyz/bin/ffmpeg.exe)",
         ]
         error_message = (
@@ -253,14 +369,15 @@ def _resolve_ffmpeg(ffmpeg_arg: Optional[Path | str]) -> None:
         logging.critical(error_message)
         sys.exit(1)
     _FFMPEG = final_ffmpeg_executable
-    logging.info(f"Final verified FFmpeg executable: {_FFMPEG}")
+    logging.info("Final verified FFmpeg executable: %s", _FFMPEG)
 
-    final_ffprobe_executable = shutil.which(_FFPROBE)
+    final_ffprobe_executable = _FFPROBE if (os.path.isabs(_FFPROBE) and os.access(_FFPROBE, os.X_OK)) \
+        else shutil.which(_FFPROBE)
     if not final_ffprobe_executable:
         search_locations_tried = [
             f"  - Argument --ffmpeg (for ffprobe near ffmpeg): {ffmpeg_arg if ffmpeg_arg else 'not provided (or path invalid)'}",
             f"  - System PATH for '{ffprobe_exe_name}'",
-            f"  - Next to script: {Path(__file__).resolve().parent / ffprobe_exe_name if '__file__' in globals() else 'N/A (interactive?)'}",
+            f"  - Next to script: {_PROJECT_ROOT / ffprobe_exe_name}",
             "  - In 'ffmpeg*' subdirectories (e.g., ./ffmpeg-xyz/ffprobe.exe or ./ffmpeg-xyz/bin/ffprobe.exe)",
         ]
         error_message = (
@@ -272,7 +389,10 @@ def _resolve_ffmpeg(ffmpeg_arg: Optional[Path | str]) -> None:
         logging.critical(error_message)
         sys.exit(1)
     _FFPROBE = final_ffprobe_executable
-    logging.info(f"Final verified FFprobe executable: {_FFPROBE}")
+    logging.info("Final verified FFprobe executable: %s", _FFPROBE)
+
+    if not ffmpeg_arg:
+        _save_ffmpeg_manifest(_FFMPEG, _FFPROBE)
 
 
 # =============================================================================
@@ -289,33 +409,88 @@ class PopenResult:
         self.stderr = stderr
 
 
+# Bytes of stderr kept by _popen_run(tail_only=True)
+_STDERR_RING_BYTES = 64 * 1024
+
+
+def _drain_tail(stream, ring: deque, on_line: Optional[Callable[[bytes], bool]] = None) -> None:
+    """Read *stream* to EOF, keeping only the last _STDERR_RING_BYTES in *ring*.
+
+    With *on_line*, the stream is split into lines first ('\n', '\r\n' or a bare '\r', which ffmpeg
+    uses for its status line); lines for which on_line() returns True (e.g. ffmpeg -progress
+    key=value lines) are consumed and not kept. on_line() gets the line without its terminator.
+    """
+    size = 0
+    partial = b""
+    # read1() returns whatever the pipe has; read(n) on a BufferedReader waits for n bytes or EOF,
+    # which would hold every progress line back until ffmpeg exits.
+    read = getattr(stream, "read1", stream.read)
+    for chunk in iter(lambda: read(65536), b""):
+        if on_line is not None:
+            lines = (partial + chunk).splitlines(keepends=True)
+            # Hold back an unterminated line, and a trailing '\r' that may be half of a '\r\n'.
+            partial = lines.pop() if lines and not lines[-1].endswith(b"\n") else b""
+            chunk = b"".join(ln for ln in lines if not on_line(ln.rstrip(b"\r\n")))
+            if not chunk:
+                continue
+        ring.append(chunk)
+        size += len(chunk)
+        while size - len(ring[0]) >= _STDERR_RING_BYTES:
+            size -= len(ring.popleft())
+    if partial and not (on_line is not None and on_line(partial.rstrip(b"\r\n"))):
+        ring.append(partial)
+    stream.close()
+
+
 def _popen_run(cmd: List[str], capture_output: bool = False, text: bool = False, check: bool = False,
-               errors: Optional[str] = None, **kwargs) -> PopenResult:
+               errors: Optional[str] = None, tail_only: bool = False,
+               on_stderr_line: Optional[Callable[[bytes], bool]] = None, **kwargs) -> PopenResult:
     """
     Runs a command using subprocess.Popen, mimicking subprocess.run,
     but with CREATE_NO_WINDOW flag on Windows to prevent console flashing.
+
+    With tail_only=True (bytes mode), stdout is discarded and stderr is drained on the calling thread,
+    keeping only its last ~64 KiB, so long ffmpeg runs don't accumulate megabytes of progress output.
+    on_stderr_line (tail_only only) sees each stderr line as it arrives; see _drain_tail.
     """
     creationflags = 0
     if os.name == 'nt':
         creationflags = subprocess.CREATE_NO_WINDOW
 
-    cmd_str = [str(c) for c in cmd]  # Ensure all command parts are strings
+    # Ensure all command parts are strings (most callers already pass str-only argv lists).
+    cmd_str = cmd if all(type(c) is str for c in cmd) else [str(c) for c in cmd]
 
     # Popen's 'errors' argument is only used if text=True (or universal_newlines=True)
     popen_errors = errors if text else None
 
     try:
-        process = subprocess.Popen(
-            cmd_str,
-            stdout=subprocess.PIPE if capture_output else None,
-            stderr=subprocess.PIPE if capture_output else None,
-            text=text,
-            errors=popen_errors,
-            creationflags=creationflags,
-            **kwargs
-        )
-        stdout, stderr = process.communicate()
-        returncode = process.returncode
+        if tail_only:
+            process = subprocess.Popen(
+                cmd_str,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                bufsize=-1,
+                creationflags=creationflags,
+                **kwargs
+            )
+            # stderr is the only pipe, so the calling thread can drain it to EOF itself
+            # (no deadlock risk, and no extra reader thread per ffmpeg process).
+            ring: deque = deque()
+            _drain_tail(process.stderr, ring, on_stderr_line)
+            returncode = process.wait()
+            stdout, stderr = b"", b"".join(ring)
+        else:
+            process = subprocess.Popen(
+                cmd_str,
+                stdout=subprocess.PIPE if capture_output else None,
+                stderr=subprocess.PIPE if capture_output else None,
+                text=text,
+                errors=popen_errors,
+                creationflags=creationflags,
+                **kwargs
+            )
+            stdout, stderr = process.communicate()
+            returncode = process.returncode
     except FileNotFoundError as e:
         # Mimic FileNotFoundError behavior of subprocess.run if executable not found
         logging.error(f"Error running command {' '.join(cmd_str)}: {e}", exc_info=True)
@@ -336,7 +511,7 @@ def _popen_run(cmd: List[str], capture_output: bool = False, text: bool = False,
 
 # Backwards-compatible list of common media extensions.
 # NOTE: We *do not* rely solely on extensions anymore; we also probe files with ffprobe.
-KNOWN_MEDIA_EXTS = {
+KNOWN_MEDIA_EXTS = frozenset({
     # Common audio
     ".wav", ".flac", ".mp3", ".m4a", ".aac", ".wma", ".ogg", ".opus",
     ".aif", ".aiff", ".aifc", ".caf", ".amr", ".au", ".snd",
@@ -349,31 +524,35 @@ KNOWN_MEDIA_EXTS = {
     ".oga", ".ogv",
     # Matroska audio
     ".mka",
-}
+})
 
 # Extensions we can *output* to while keeping the same container/extension.
 # For other inputs, we default output to .mp3 for maximum compatibility.
-OUTPUT_EXTS = {".mp3", ".m4a", ".aac", ".flac", ".wav", ".wma", ".ogg", ".opus"}
+OUTPUT_EXTS = frozenset({".mp3", ".m4a", ".aac", ".flac", ".wav", ".wma", ".ogg", ".opus"})
 
 # Extensions where video streams are valid/expected in the container.
-VIDEO_CONTAINER_EXTS = {
+VIDEO_CONTAINER_EXTS = frozenset({
     ".mkv", ".mp4", ".m4v", ".mov", ".webm", ".avi", ".ts", ".m2ts", ".mts",
     ".mpg", ".mpeg", ".mpe", ".m2v", ".vob", ".wmv", ".asf", ".flv", ".f4v",
     ".3gp", ".3g2", ".ogv",
-}
+})
+
+# Audio containers where embedded cover art (attached_pic) is carried over to the output.
+COVER_ART_EXTS = frozenset({".mp3", ".m4a", ".flac"})
 
 # A small ignore list so we don't ffprobe obvious non-media files in large folders.
-IGNORE_EXTS = {
+IGNORE_EXTS = frozenset({
     ".jpg", ".jpeg", ".png", ".gif", ".bmp", ".webp", ".tif", ".tiff",
     ".txt", ".md", ".pdf", ".doc", ".docx", ".ppt", ".pptx", ".xls", ".xlsx", ".csv",
     ".json", ".xml", ".html", ".htm", ".css", ".js", ".py", ".ini", ".log",
     ".zip", ".rar", ".7z", ".tar", ".gz", ".bz2", ".xz", ".iso",
     ".exe", ".dll",
     ".bak",
-}
+})
 
 
 
+@functools.lru_cache(maxsize=64)
 def _choose_output_ext(input_ext: str, has_real_video: bool) -> str:
     """Decide output extension.
 
@@ -390,52 +569,89 @@ def _choose_output_ext(input_ext: str, has_real_video: bool) -> str:
         return in_ext
     return ".mp3"
 
-_FFMPEG_IGNORE_LINES = re.compile(
-    r"^(ffmpeg version\b|"
-    r"built with\b|"
-    r"configuration:|"
-    r"libav\w+\s+.*?\s+/\s+.*|"
-    r"\s*--(?:[a-zA-Z0-9_-]+=.*|[\w-]+)|"
-    r"Incorrect BOM value|"
-    r"Error reading comment frame, skipped)"
+# Banner / noise lines dropped from ffmpeg stderr: literal prefixes are checked with str.startswith,
+# only the two structural patterns (library version table, configure flags) need a regex.
+_IGNORE_PREFIXES = (
+    "ffmpeg version",
+    "built with",
+    "configuration:",
+    "Incorrect BOM value",
+    "Error reading comment frame, skipped",
 )
+_IGNORE_RE = re.compile(r"^(?:libav\w+\s+.*?\s+/\s+|\s*--[\w-])")
+
+
+# Sample rate / bitrate in `ffmpeg -i` stream lines (probe fallback when ffprobe JSON is unavailable)
+_RE_HZ = re.compile(r"(\d+)\s*Hz")
+_RE_KBPS = re.compile(r"(\d+)\s*kb/s")
+
+
+# Only the end of ffmpeg's stderr is ever shown, so only that much is decoded.
+_STDERR_TAIL_BYTES = 64 * 1024
 
 
 def _clean_ffmpeg_err(raw: bytes) -> str:
-    lines = raw.decode(errors="ignore").splitlines()
-    meaningful_lines = [ln for ln in lines if not _FFMPEG_IGNORE_LINES.match(ln)]
+    text = raw[-_STDERR_TAIL_BYTES:].decode(errors="ignore")
+    if len(raw) > _STDERR_TAIL_BYTES:
+        # Drop the (probably partial) first line of the truncated tail.
+        text = text.split("\n", 1)[-1]
+    lines = text.splitlines()
+    # Bind the globals once; the comprehension runs per stderr line.
+    prefixes, ignore_match = _IGNORE_PREFIXES, _IGNORE_RE.match
+    meaningful_lines = [ln for ln in lines if not (ln.startswith(prefixes) or ignore_match(ln))]
     return "\n".join(meaningful_lines[-15:]) if meaningful_lines else "(no ffmpeg stderr captured)"
 
 
 def _unique_backup_path(p: Path) -> Path:
-    """Return a non-existing backup path like 'file.ext.bak', 'file.ext.bak1', ..."""
-    base = p.with_name(p.name + ".bak")
-    if not base.exists():
-        return base
-    for i in range(1, 1000):
-        cand = p.with_name(p.name + f".bak{i}")
-        if not cand.exists():
+    """Reserve and return a fresh backup path: 'file.ext.bak', else 'file.ext.<ns>.bak'.
+
+    The name is claimed with an O_CREAT|O_EXCL placeholder (one syscall instead of probing
+    .bak1...bak999); the caller os.replace()s the original onto it. Names keep the '.bak'
+    extension so the folder scan keeps ignoring them.
+    """
+    flags = os.O_CREAT | os.O_EXCL | os.O_WRONLY
+    for name in (f"{p.name}.bak", f"{p.name}.{time.time_ns()}.bak", f"{p.name}.{time.time_ns()}-{os.getpid()}.bak"):
+        cand = p.with_name(name)
+        try:
+            os.close(os.open(str(cand), flags, 0o600))
             return cand
-    raise RuntimeError(f"Too many backups already exist for: {p}")
+        except FileExistsError:
+            continue
+    raise RuntimeError(f"Could not reserve a backup name for: {p}")
 
 
-def _replace_original_with_backup(original: Path, new_file: Path) -> None:
-    """Atomically replace 'original' with 'new_file', keeping a .bak copy of the original."""
-    backup = _unique_backup_path(original)
+def _replace_original_with_backup(original: Path, new_file: Path, backup: bool = True) -> bool:
+    """Atomically replace 'original' with 'new_file', keeping a .bak copy of the original.
+
+    With backup=False the original is simply overwritten by a single os.replace().
+    Returns True once swapped. On failure the original is restored where possible, 'new_file'
+    is removed and the error is re-raised, so callers never need to clean up after it.
+    """
+    backup_path: Optional[Path] = None
     try:
-        os.replace(str(original), str(backup))
+        if backup:
+            backup_path = _unique_backup_path(original)
+            os.replace(str(original), str(backup_path))
         os.replace(str(new_file), str(original))
+        return True
     except Exception:
-        # Best-effort rollback: if original is missing but backup exists, restore it.
+        # Best-effort rollback: if original is missing but backup exists, restore it;
+        # otherwise drop the unused (empty) backup placeholder.
+        try:
+            if backup_path is not None:
+                if not original.exists() and backup_path.exists():
+                    os.replace(str(backup_path), str(original))
+                elif backup_path.exists() and backup_path.stat().st_size == 0:
+                    backup_path.unlink()
+        except Exception:
+            pass
         try:
-            if not original.exists() and backup.exists():
-                os.replace(str(backup), str(original))
+            new_file.unlink(missing_ok=True)
         except Exception:
             pass
         raise
 
 
-
 HQ_CODEC: dict[str, List[str]] = {
     ".mp3": ["-c:a", "libmp3lame", "-b:a", "320k", "-compression_level", "0"],
     ".m4a": ["-c:a", "aac", "-b:a", "512k", "-movflags", "+faststart"],
@@ -489,13 +705,118 @@ SAFE_CODEC: dict[str, List[str]] = {
 }
 
 
-def _codec_for_ext(ext: str, safe: bool = False) -> List[str]:
+@functools.lru_cache(maxsize=None)
+def _codec_for_ext(ext: str, safe: bool = False) -> Tuple[str, ...]:
+    """Codec options for *ext*; a tuple because the result is cached and shared between callers."""
     ext = ext.lower()
     default_codec = ["-c:a", "aac", "-b:a", "320k"]
     if ext in [".flac", ".wav"]:  # For lossless, default to safe copy-like options if not specified
         default_codec = SAFE_CODEC.get(ext, ["-c:a", "copy"])  # Should ideally not happen if ext is supported
 
-    return (SAFE_CODEC if safe else HQ_CODEC).get(ext, default_codec)
+    return tuple((SAFE_CODEC if safe else HQ_CODEC).get(ext, default_codec))
+
+
+@functools.lru_cache(maxsize=64)
+def _bitrate_slot(codec_options: Tuple[str, ...]) -> Tuple[Optional[int], int]:
+    """Index of the '-b:a' value in *codec_options* and that bitrate in bps, or (None, -1)."""
+    try:
+        idx = codec_options.index("-b:a") + 1
+        target_br_str = codec_options[idx]
+    except (ValueError, IndexError):
+        return None, -1
+    try:
+        if target_br_str.lower().endswith("k"):
+            return idx, int(target_br_str[:-1]) * 1000
+        if target_br_str.isdigit():
+            return idx, int(target_br_str)
+    except ValueError:
+        pass
+    return None, -1
+
+
+def _adjust_bitrate_in_options(codec_options: Tuple[str, ...], orig_bps: Optional[int], src_name: str) -> List[str]:
+    """Return *codec_options* as a list, capping '-b:a' at the source bitrate (no point encoding above it)."""
+    idx, target_bps = _bitrate_slot(codec_options)
+    if orig_bps is None or idx is None or orig_bps >= target_bps:
+        return list(codec_options)
+    adjusted_options = list(codec_options)
+    adjusted_options[idx] = f"{orig_bps // 1000}k"
+    logging.info(
+        f"Adjusting target bitrate from {codec_options[idx]} to original {adjusted_options[idx]} for {src_name}"
+    )
+    return adjusted_options
+
+
+# Concurrent ffprobe processes while scanning a folder
+_PROBE_WORKERS = min(32, (os.cpu_count() or 4) * 4)
+
+
+def _walk_candidates(folder: str, recursive: bool):
+    """Yield ``os.DirEntry`` objects for files in *folder* that are worth probing.
+
+    Uses an explicit stack of ``os.scandir`` iterators so name/extension checks run on the raw
+    entry name (no Path objects, no extra stat calls) before anything is probed.
+    """
+    stack = [folder]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                name = entry.name
+                try:
+                    # d_type from the directory read: no stat() on Linux/Windows.
+                    if entry.is_dir(follow_symlinks=False):
+                        # Avoid re-processing output folders placed inside the source tree.
+                        if recursive and not name.endswith("_432Hz"):
+                            stack.append(entry.path)
+                        continue
+                except OSError:
+                    continue
+
+                # Name-only filters come before is_file(), which may need a stat() (e.g. for symlinks).
+                # Same split as Path.suffix/Path.stem: a leading dot (".hidden") is not an extension.
+                name_lower = name.lower()
+                dot = name_lower.rfind(".")
+                ext = name_lower[dot:] if 0 < dot < len(name_lower) - 1 else ""
+
+                # Unknown extensions are still probed (supports odd/rare formats);
+                # only clearly non-media extensions are skipped here.
+                if ext in IGNORE_EXTS:
+                    continue
+
+                # Skip partial torrent chunk files and temp files created during in-place replacement.
+                if name.startswith("~BitTorrentPartFile_") or ".__tmp432__" in name:
+                    continue
+
+                # Skip already-converted outputs when "same folder" mode is used.
+                # (Output naming appends "_432" or "_432Hz" to the stem.)
+                stem_l = name_lower[: -len(ext)] if ext else name_lower
+                if stem_l.endswith(("_432", "_432hz", "_432_hz")):
+                    continue
+
+                try:
+                    if not entry.is_file():
+                        continue
+                except OSError:
+                    continue
+
+                yield entry
+
+
+def iter_audio_files(folder: Path, recursive: bool) -> Iterator[Path]:
+    """Yield files under *folder* that may contain audio, as they are found.
+
+    Only the name/extension pre-filter is applied; callers still probe each file
+    (see find_audio_files for the fully probed list).
+    """
+    # Scanning inside an output folder would only find already-converted files.
+    if any(part.endswith("_432Hz") for part in folder.parts):
+        return
+    for entry in _walk_candidates(str(folder), recursive):
+        yield Path(entry.path)
 
 
 def find_audio_files(folder: Path, recursive: bool) -> List[Path]:
@@ -504,48 +825,74 @@ def find_audio_files(folder: Path, recursive: bool) -> List[Path]:
     We *prefer* extensions for a quick pre-filter, but ultimately we verify with ffprobe.
     This makes the app work with FLAC and essentially any format FFmpeg can decode.
     """
-    pattern = "**/*" if recursive else "*"
-    out: List[Path] = []
-    for p in folder.glob(pattern):
-        if not p.is_file():
-            continue
-
-        # Avoid re-processing output folders placed inside the source tree.
-        if any(str(part).endswith("_432Hz") for part in p.parts):
-            continue
-
-        # Skip partial torrent chunk files and other non-media temp files by name.
-        if p.name.startswith("~BitTorrentPartFile_"):
-            continue
+    candidates: List[Path] = list(iter_audio_files(folder, recursive))
 
-        # Skip temp files created during in-place replacement.
-        if ".__tmp432__" in p.name:
-            continue
+    if not candidates:
+        return []
+    # Each probe is an ffprobe subprocess (the GIL is released while waiting), so probe concurrently.
+    # map() keeps the original traversal order.
+    workers = min(len(candidates), _PROBE_WORKERS)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        infos = list(pool.map(_probe_media_info, candidates))
+    return [p for p, info in zip(candidates, infos) if info[0]]
 
-        # Skip already-converted outputs when "same folder" mode is used.
-        # (Output naming appends "_432" or "_432Hz" to the stem.)
-        stem_l = p.stem.lower()
-        if stem_l.endswith("_432") or stem_l.endswith("_432hz") or stem_l.endswith("_432_hz"):
-            continue
 
-        ext = p.suffix.lower()
-        if ext in IGNORE_EXTS:
-            continue
+# ffprobe results persisted across runs, keyed by (path, mtime_ns, size) so edited files are re-probed.
+_PROBE_CACHE_DB = _APP_DATA_DIR / "probe.sqlite3"
+_probe_db_conn = None
+_probe_db_disabled = sqlite3 is None
+_PROBE_DB_LOCK = threading.Lock()
 
-        # If the extension is unknown, we still try probing (supports odd/rare formats).
-        # If the extension is known media, probing is expected.
-        if ext and ext not in KNOWN_MEDIA_EXTS:
-            # Still probe, but skip clearly non-media extensions above.
-            pass
 
-        has_audio, *_ = _probe_media_info(p)
-        if has_audio:
-            out.append(p)
-    return out
+def _probe_db():
+    """Open the on-disk probe cache on first use; returns None if it is unavailable."""
+    global _probe_db_conn, _probe_db_disabled
+    if _probe_db_conn is None and not _probe_db_disabled:
+        try:
+            _APP_DATA_DIR.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(_PROBE_CACHE_DB), isolation_level=None, check_same_thread=False)
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS probe (path TEXT PRIMARY KEY, mtime_ns INT, size INT, "
+                "has_audio INT, has_video INT, has_pic INT, sr INT, br INT)"
+            )
+            _probe_db_conn = conn
+        except (OSError, sqlite3.Error) as e:
+            logging.info(f"Probe cache disabled ({_PROBE_CACHE_DB}): {e}")
+            _probe_db_disabled = True
+    return _probe_db_conn
+
+
+def _probe_cache_get(p: Path, mtime_ns: int, size: int) -> Optional[Tuple[bool, bool, bool, Optional[int], Optional[int]]]:
+    with _PROBE_DB_LOCK:
+        conn = _probe_db()
+        if conn is None:
+            return None
+        try:
+            row = conn.execute(
+                "SELECT has_audio, has_video, has_pic, sr, br FROM probe WHERE path=? AND mtime_ns=? AND size=?",
+                (str(p), mtime_ns, size),
+            ).fetchone()
+        except sqlite3.Error:
+            return None
+    if row is None:
+        return None
+    return bool(row[0]), bool(row[1]), bool(row[2]), row[3], row[4]
 
 
-# Cache to avoid repeated ffprobe calls on the same file during a run.
-_MEDIA_INFO_CACHE: dict[Path, Tuple[bool, bool, bool, Optional[int], Optional[int]]] = {}
+def _probe_cache_put(p: Path, mtime_ns: int, size: int,
+                     result: Tuple[bool, bool, bool, Optional[int], Optional[int]]) -> None:
+    with _PROBE_DB_LOCK:
+        conn = _probe_db()
+        if conn is None:
+            return
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO probe VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (str(p), mtime_ns, size, int(result[0]), int(result[1]), int(result[2]),
+                 result[3], result[4]),
+            )
+        except sqlite3.Error as e:
+            logging.debug(f"Could not store probe result for {p.name}: {e}")
 
 
 def _probe_media_info(path: Path) -> Tuple[bool, bool, bool, Optional[int], Optional[int]]:
@@ -556,9 +903,31 @@ def _probe_media_info(path: Path) -> Tuple[bool, bool, bool, Optional[int], Opti
     - "real video" excludes embedded cover art (attached_pic).
     - sample_rate_hz is guaranteed when has_audio=True (falls back to 44100 if needed).
     """
-    p = path.expanduser().resolve()
-    if p in _MEDIA_INFO_CACHE:
-        return _MEDIA_INFO_CACHE[p]
+    # Scanner paths are already absolute; only relative paths pay for resolve() (a realpath walk).
+    p = path.expanduser()
+    if not p.is_absolute():
+        p = p.resolve()
+    key = os.fspath(p)
+    try:
+        st = os.stat(key)
+    except OSError:
+        return _probe_media_info_uncached(p, None)
+    return _probe_media_info_cached(key, st.st_mtime_ns, st.st_size)
+
+
+# In-process memo that survives across Start clicks; the (mtime_ns, size) part of the key makes
+# edited or replaced files miss the cache instead of returning stale results.
+@functools.lru_cache(maxsize=4096)
+def _probe_media_info_cached(path_str: str, mtime_ns: int, size: int) -> Tuple[bool, bool, bool, Optional[int], Optional[int]]:
+    return _probe_media_info_uncached(Path(path_str), (mtime_ns, size))
+
+
+def _probe_media_info_uncached(p: Path, stamp: Optional[Tuple[int, int]]) -> Tuple[bool, bool, bool, Optional[int], Optional[int]]:
+    """Run the probe for *p*; *stamp* is its (mtime_ns, size), or None if it could not be stat'ed."""
+    if stamp is not None:
+        cached = _probe_cache_get(p, *stamp)
+        if cached is not None:
+            return cached
 
     has_audio = False
     has_real_video = False
@@ -567,43 +936,60 @@ def _probe_media_info(path: Path) -> Tuple[bool, bool, bool, Optional[int], Opti
     bit_rate: Optional[int] = None
 
     # --- Method 1: ffprobe JSON (best: can detect attached pics) ---
+    # A clean exit with parseable JSON is final -- including "no audio" -- so the ffmpeg fallback
+    # is not a second opinion on every non-media file. A non-zero exit (file locked, unreadable,
+    # still being copied) also prints '{}', but must not be recorded as a permanent negative.
     cmd_probe = [
         _FFPROBE, "-v", "quiet", "-print_format", "json",
-        "-show_streams", str(p)
+        # Only the fields parsed below; -show_streams would dump every field of every stream.
+        "-show_entries", "stream=codec_type,sample_rate,bit_rate:stream_disposition=attached_pic",
+        str(p)
     ]
+    probed_ok = False
     try:
-        process = _popen_run(cmd_probe, capture_output=True, text=True, check=False, errors="ignore")
+        # Raw bytes: both orjson and json.loads parse UTF-8 bytes without a separate decode step.
+        process = _popen_run(cmd_probe, capture_output=True, text=False, check=False)
         if process.returncode == 0 and process.stdout:
-            ffprobe_output = json.loads(process.stdout)
+            ffprobe_output = _json_loads(process.stdout)
             for stream in ffprobe_output.get("streams", []) or []:
                 ctype = stream.get("codec_type")
                 if ctype == "audio" and not has_audio:
                     has_audio = True
                     sr_str = stream.get("sample_rate")
-                    if sr_str and str(sr_str).isdigit():
-                        sample_rate = int(sr_str)
+                    if sr_str is not None:
+                        try:
+                            sample_rate = int(sr_str)
+                        except (TypeError, ValueError):
+                            pass
                     br_str = stream.get("bit_rate")
-                    if br_str and str(br_str).isdigit():
-                        bit_rate = int(br_str)
+                    if br_str is not None:
+                        try:
+                            bit_rate = int(br_str)
+                        except (TypeError, ValueError):
+                            pass
                 elif ctype == "video":
                     disp = stream.get("disposition") or {}
-                    try:
-                        attached = int(disp.get("attached_pic", 0)) == 1
-                    except Exception:
-                        attached = False
-                    if attached:
+                    if disp.get("attached_pic") == 1:  # ffprobe emits disposition flags as ints
                         has_attached_pic = True
                     else:
                         has_real_video = True
-            if has_audio and sample_rate is None:
-                sample_rate = 44100
-
-            result = (has_audio, has_real_video, has_attached_pic, sample_rate, bit_rate)
-            _MEDIA_INFO_CACHE[p] = result
-            return result
+            probed_ok = True
     except Exception as e:
         logging.warning(f"ffprobe probe failed for {p.name}: {e}", exc_info=False)
 
+    if probed_ok:
+        if has_audio and sample_rate is None:
+            sample_rate = 44100
+        result = (has_audio, has_real_video, has_attached_pic, sample_rate, bit_rate)
+        # Only ffprobe answers are persisted; the ffmpeg -i fallback is a stopgap for a broken ffprobe.
+        if stamp is not None:
+            _probe_cache_put(p, *stamp, result)
+        return result
+
+    # Reset anything a half-parsed ffprobe run may have set.
+    has_audio = has_real_video = has_attached_pic = False
+    sample_rate = bit_rate = None
+
     # --- Method 2: ffmpeg -i parse (fallback) ---
     cmd_ffmpeg = [_FFMPEG, "-i", str(p)]
     try:
@@ -614,8 +1000,8 @@ def _probe_media_info(path: Path) -> Tuple[bool, bool, bool, Optional[int], Opti
         if "Video:" in output:
             has_real_video = True
         if has_audio:
-            sr_match = re.search(r"(\d+)\s*Hz", output)
-            br_match = re.search(r"(\d+)\s*kb/s", output)
+            sr_match = _RE_HZ.search(output)
+            br_match = _RE_KBPS.search(output)
             if sr_match:
                 sample_rate = int(sr_match.group(1))
             if br_match:
@@ -625,9 +1011,64 @@ def _probe_media_info(path: Path) -> Tuple[bool, bool, bool, Optional[int], Opti
     except Exception as e:
         logging.warning(f"ffmpeg probe failed for {p.name}: {e}", exc_info=False)
 
-    result = (has_audio, has_real_video, has_attached_pic, sample_rate, bit_rate)
-    _MEDIA_INFO_CACHE[p] = result
-    return result
+    return has_audio, has_real_video, has_attached_pic, sample_rate, bit_rate
+
+
+def _probe_audio_only(path: Path) -> Tuple[bool, bool, bool, Optional[int], Optional[int]]:
+    """Like _probe_media_info, but only looks at the first audio stream where that is enough.
+
+    In-place replacement keeps the source extension, and for extensions outside
+    VIDEO_CONTAINER_EXTS and COVER_ART_EXTS the video flags never change the ffmpeg command,
+    so they are reported as False. Other extensions get the full probe.
+    """
+    p = path.expanduser()
+    if not p.is_absolute():
+        p = p.resolve()
+    suffix = p.suffix.lower()
+    if suffix in VIDEO_CONTAINER_EXTS or suffix in COVER_ART_EXTS:
+        return _probe_media_info(p)
+    key = os.fspath(p)
+    try:
+        st = os.stat(key)
+    except OSError:
+        return _probe_media_info(p)
+    return _probe_audio_only_cached(key, st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=4096)
+def _probe_audio_only_cached(path_str: str, mtime_ns: int, size: int) -> Tuple[bool, bool, bool, Optional[int], Optional[int]]:
+    p = Path(path_str)
+    # A full probe persisted by an earlier run already has everything needed.
+    cached = _probe_cache_get(p, mtime_ns, size)
+    if cached is not None:
+        return cached[0], False, False, cached[3], cached[4]
+
+    cmd_probe = [
+        _FFPROBE, "-v", "quiet", "-print_format", "json",
+        "-select_streams", "a:0", "-show_entries", "stream=sample_rate,bit_rate",
+        path_str,
+    ]
+    try:
+        process = _popen_run(cmd_probe, capture_output=True, text=False, check=False)
+        if process.returncode == 0 and process.stdout:
+            streams = _json_loads(process.stdout).get("streams", []) or []
+            sample_rate: Optional[int] = None
+            bit_rate: Optional[int] = None
+            if streams:
+                try:
+                    sample_rate = int(streams[0].get("sample_rate"))
+                except (TypeError, ValueError):
+                    sample_rate = 44100
+                try:
+                    bit_rate = int(streams[0].get("bit_rate"))
+                except (TypeError, ValueError):
+                    pass
+            # Not persisted: the probe cache stores full answers, and the video flags here are not probed.
+            return bool(streams), False, False, sample_rate, bit_rate
+    except Exception as e:
+        logging.warning(f"ffprobe audio probe failed for {p.name}: {e}", exc_info=False)
+    # ffprobe missing/broken or failed on this file: the full probe knows how to fall back to ffmpeg -i.
+    return _probe_media_info_cached(path_str, mtime_ns, size)
 
 
 def _get_audio_metadata(path: Path) -> Tuple[Optional[int], Optional[int]]:
@@ -642,6 +1083,80 @@ def _get_audio_metadata(path: Path) -> Tuple[Optional[int], Optional[int]]:
 # 2.  Conversion function with automatic retry
 # =============================================================================
 
+# Duration‑preserving pitch shift (keeps video + subtitles perfectly synced):
+#   1) Change sample rate (changes pitch + speed)
+#   2) atempo compensates the speed back to original duration
+#   3) resample to target sample rate
+_PITCH_RATIO = 432 / 440
+_CHAIN_TEMPLATE = f"asetrate={{}}*{_PITCH_RATIO},atempo={1 / _PITCH_RATIO},aresample={{}}"
+
+
+_RE_DURATION = re.compile(rb"Duration:\s*(\d+):(\d+):(\d+(?:\.\d+)?)")
+_RE_PROGRESS_KEY = re.compile(rb"[a-z0-9_]+=")
+
+
+def _progress_line_handler(progress: Callable[[float], None]) -> Callable[[bytes], bool]:
+    """Build an on_stderr_line callback turning ffmpeg '-progress pipe:2' output into fractions.
+
+    The input duration comes from ffmpeg's own 'Duration:' header line; key=value progress lines
+    are consumed (returns True) so they don't crowd real errors out of the stderr tail.
+    """
+    duration_us = 0
+    seen_us = False
+
+    def _on_line(line: bytes) -> bool:
+        nonlocal duration_us, seen_us
+        # out_time_ms is also in microseconds; older ffmpeg builds only print that one.
+        if line.startswith(b"out_time_us=") or (not seen_us and line.startswith(b"out_time_ms=")):
+            seen_us = seen_us or line.startswith(b"out_time_us=")
+            if duration_us > 0:
+                try:
+                    progress(min(1.0, int(line.partition(b"=")[2]) / duration_us))
+                except ValueError:
+                    pass
+            return True
+        if _RE_PROGRESS_KEY.match(line):
+            return True  # other -progress keys (frame=, bitrate=, progress=end, ...)
+        if not duration_us and b"Duration:" in line:
+            m = _RE_DURATION.search(line)
+            if m:
+                h, mnt, sec = m.groups()
+                duration_us = int((int(h) * 3600 + int(mnt) * 60 + float(sec)) * 1_000_000)
+        return False
+
+    return _on_line
+
+
+@functools.lru_cache(maxsize=32)
+def _filter_chain(original_sr: int, target_sr: int) -> str:
+    """The -af chain for a source/target sample-rate pair (a batch only ever sees a few pairs)."""
+    return _CHAIN_TEMPLATE.format(original_sr, target_sr)
+
+
+@functools.lru_cache(maxsize=None)
+def _ffmpeg_template(ext: str, has_real_video: bool, has_attached_pic: bool) -> Tuple[str, ...]:
+    """Output-side mapping/stream-copy args for *ext*, ending with the audio filter flag (chain goes next)."""
+    if has_real_video and ext in VIDEO_CONTAINER_EXTS:
+        # Preserve everything we can (subtitles, attachments, chapters, metadata), re-encode audio.
+        if ext == ".mkv":
+            map_args = ["-map", "0", "-map_metadata", "0", "-map_chapters", "0", "-copy_unknown"]
+            stream_copy_args = ["-c", "copy"]
+        else:
+            # Safer mapping for non-MKV containers (some don't support attachments)
+            map_args = [
+                "-map", "0:v?", "-map", "0:a?", "-map", "0:s?", "-map", "0:d?",
+                "-map_metadata", "0", "-map_chapters", "0",
+            ]
+            stream_copy_args = ["-c:v", "copy", "-c:s", "copy", "-c:d", "copy"]
+        return tuple(map_args + stream_copy_args + ["-filter:a"])
+
+    # Audio-only outputs: map audio (and optional cover art where supported).
+    map_args = ["-map", "0:a?"]
+    if (not has_real_video) and has_attached_pic and ext in COVER_ART_EXTS:
+        map_args += ["-map", "0:v?", "-c:v", "copy"]
+    return tuple(map_args + ["-af"])
+
+
 def convert_to_432(
         src: Path,
         dst: Path,
@@ -651,75 +1166,41 @@ def convert_to_432(
         *,
         has_real_video: bool = False,
         has_attached_pic: bool = False,
+        ffmpeg_threads: Optional[int] = None,
+        progress: Optional[Callable[[float], None]] = None,
 ) -> None:
     """Convert audio pitch from 440→432 Hz while preserving duration.
 
     - For videos: copies video + subtitle streams (keeps original timing/sync) and re-encodes audio only.
     - For audio: converts audio and preserves cover art where possible.
+    - ffmpeg_threads caps ffmpeg's own threading (used when several conversions run in parallel).
+    - progress, if given, is called on the calling thread with the completed fraction (0.0-1.0),
+      parsed from ffmpeg's -progress output.
     """
     logging.info(f"Converting {src} to {dst} with original SR {original_sr}, target SR {target_sr}")
     dst.parent.mkdir(parents=True, exist_ok=True)
 
-    # Duration‑preserving pitch shift (keeps video + subtitles perfectly synced):
-    #   1) Change sample rate (changes pitch + speed)
-    #   2) atempo compensates the speed back to original duration
-    #   3) resample to target sample rate
-    ratio = 432 / 440
-    chain = f"asetrate={original_sr}*{ratio},atempo={1/ratio},aresample={target_sr}"
+    chain = _filter_chain(original_sr, target_sr)
+
+    on_line = _progress_line_handler(progress) if progress is not None else None
 
     def _run(cmd_list: List[str]):
         logging.debug(f"Executing ffmpeg command: {' '.join(cmd_list)}")
-        return _popen_run(cmd_list, capture_output=True, text=False)
-
-    def _adjust_bitrate_in_options(codec_options: List[str], orig_bps: Optional[int]) -> List[str]:
-        if orig_bps is None:
-            return codec_options
-        adjusted_options = list(codec_options)
-        try:
-            b_a_idx = adjusted_options.index("-b:a")
-            if b_a_idx + 1 < len(adjusted_options):
-                target_br_str = adjusted_options[b_a_idx + 1]
-                target_bps = -1
-                if target_br_str.lower().endswith("k"):
-                    target_bps = int(target_br_str[:-1]) * 1000
-                elif target_br_str.isdigit():
-                    target_bps = int(target_br_str)
-                if target_bps != -1 and orig_bps < target_bps:
-                    adjusted_options[b_a_idx + 1] = f"{orig_bps // 1000}k"
-                    logging.info(
-                        f"Adjusting target bitrate from {target_br_str} to original {adjusted_options[b_a_idx + 1]} for {src.name}"
-                    )
-        except (ValueError, IndexError):
-            pass
-        return adjusted_options
+        return _popen_run(cmd_list, capture_output=True, text=False, tail_only=True, on_stderr_line=on_line)
 
     ext = dst.suffix.lower()
     is_video_container = ext in VIDEO_CONTAINER_EXTS
 
-    # Build base command (mapping/stream copy strategy)
-    if has_real_video and is_video_container:
-        # Preserve everything we can (subtitles, attachments, chapters, metadata), re-encode audio.
-        if ext == ".mkv":
-            map_args = ["-map", "0", "-map_metadata", "0", "-map_chapters", "0", "-copy_unknown"]
-            stream_copy_args = ["-c", "copy"]
-        else:
-            # Safer mapping for non-MKV containers (some don't support attachments)
-            map_args = [
-                "-map", "0:v?", "-map", "0:a?", "-map", "0:s?", "-map", "0:d?",
-                "-map_metadata", "0", "-map_chapters", "0",
-            ]
-            stream_copy_args = ["-c:v", "copy", "-c:s", "copy", "-c:d", "copy"]
-
-        base_cmd_list = [_FFMPEG, "-y", "-i", str(src)] + map_args + stream_copy_args + ["-filter:a", chain]
-    else:
-        # Audio-only outputs: map audio (and optional cover art where supported).
-        map_args: List[str] = ["-map", "0:a?"]
-        if (not has_real_video) and has_attached_pic and ext in {".mp3", ".m4a", ".flac"}:
-            map_args += ["-map", "0:v?", "-c:v", "copy"]
-        base_cmd_list = [_FFMPEG, "-y", "-i", str(src)] + map_args + ["-af", chain]
+    # Build base command (mapping/stream copy strategy); everything after the input is per-ext/stream-layout constant.
+    base_cmd_list = [_FFMPEG, "-y", "-i", str(src), *_ffmpeg_template(ext, has_real_video, has_attached_pic), chain]
+    if ffmpeg_threads:
+        base_cmd_list += ["-threads", str(ffmpeg_threads)]
+    if progress is not None:
+        # Machine-readable progress on stderr instead of the interactive stats line.
+        base_cmd_list[1:1] = ["-progress", "pipe:2", "-nostats"]
 
     # Try HQ first
-    hq_options = _adjust_bitrate_in_options(_codec_for_ext(ext, safe=False), original_bitrate_bps)
+    hq_options = _adjust_bitrate_in_options(_codec_for_ext(ext, safe=False), original_bitrate_bps, src.name)
     hq_cmd_list = base_cmd_list + hq_options + [str(dst)]
     proc = _run(hq_cmd_list)
     if proc.returncode == 0:
@@ -744,7 +1225,7 @@ def convert_to_432(
 
     logging.warning(f"HQ conversion failed for {src.name}. Retrying with safe settings. Error:\n{hq_stderr_cleaned}")
 
-    safe_options = _adjust_bitrate_in_options(_codec_for_ext(ext, safe=True), original_bitrate_bps)
+    safe_options = _adjust_bitrate_in_options(_codec_for_ext(ext, safe=True), original_bitrate_bps, src.name)
     safe_cmd_list = base_cmd_list + safe_options + [str(dst)]
     proc_safe = _run(safe_cmd_list)
     if proc_safe.returncode == 0:
@@ -755,6 +1236,223 @@ def convert_to_432(
     final_err_message = f"HQ error:\n{hq_stderr_cleaned}\nSafe error:\n{safe_stderr_cleaned}"
     raise subprocess.CalledProcessError(proc_safe.returncode, proc_safe.args, stderr=final_err_message)
 
+class ConvertJob(NamedTuple):
+    """Arguments for one convert_to_432() call, as queued by convert_many()."""
+    src: Path
+    dst: Path
+    original_sr: int
+    target_sr: int
+    original_bitrate_bps: Optional[int]
+    has_real_video: bool = False
+    has_attached_pic: bool = False
+
+
+# Parallel ffmpeg processes for batch conversions (each is mostly single-threaded for our filter chain)
+_CONVERT_WORKERS = os.cpu_count() or 1
+# GUI probe/plan threads feeding the conversions (ffprobe is quick next to a conversion)
+_PLAN_WORKERS = 4
+
+
+def convert_many(
+        jobs: Iterable[ConvertJob],
+        workers: Optional[int] = None,
+        on_done: Optional[Callable[[ConvertJob, Optional[BaseException]], None]] = None,
+        on_progress: Optional[Callable[[ConvertJob, float], None]] = None,
+) -> None:
+    """Run convert_to_432() for every job, up to *workers* ffmpeg processes at a time.
+
+    *jobs* is consumed lazily (a new job is only pulled when a slot is free), so callers can probe
+    and plan files while earlier ones are converting. on_done(job, error) is called from a worker
+    thread after each job; error is None on success. on_progress(job, fraction) reports progress
+    within a running job (see convert_to_432's progress argument).
+    """
+    workers = max(1, workers or _CONVERT_WORKERS)
+    # With several ffmpeg processes running, one thread each avoids oversubscribing the CPU.
+    ffmpeg_threads = 1 if workers > 1 else None
+    slots = threading.BoundedSemaphore(workers)
+
+    def _run_job(job: ConvertJob) -> None:
+        try:
+            error: Optional[BaseException] = None
+            try:
+                convert_to_432(
+                    job.src, job.dst, job.original_sr, job.target_sr, job.original_bitrate_bps,
+                    has_real_video=job.has_real_video,
+                    has_attached_pic=job.has_attached_pic,
+                    ffmpeg_threads=ffmpeg_threads,
+                    progress=(lambda fraction: on_progress(job, fraction)) if on_progress is not None else None,
+                )
+            except Exception as e:
+                error = e
+            if on_done is not None:
+                on_done(job, error)
+        except Exception:
+            logging.exception(f"convert_many: completion handler failed for {job.src}")
+        finally:
+            slots.release()
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for job in jobs:
+            slots.acquire()
+            pool.submit(_run_job, job)
+
+
+class _RunConfig(NamedTuple):
+    """Options for one batch, snapshotted from the GUI so pool threads never touch Tk variables."""
+    src: Path
+    dst_base: Path
+    src_is_dir: bool
+    replace_original: bool = False
+    keep_backup: bool = True
+    same_folder: bool = False
+    skip_existing: bool = False
+    target_sr: int = 48000
+    # Sizes of files already under dst_base (built once per run when skip_existing is set)
+    existing_sizes: Optional[dict] = None
+
+
+def _scan_file_sizes(root: Path) -> dict:
+    """Map every file path under *root* to its size with one scandir walk (sizes come from the walk's stat)."""
+    sizes: dict = {}
+    stack = [str(root)]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file():
+                        sizes[entry.path] = entry.stat().st_size
+                except OSError:
+                    continue
+    return sizes
+
+
+def _dst_builder(cfg: _RunConfig) -> Callable[[str, str, str], str]:
+    """Pick the destination-path rule for this run once: fn(f_str, stem, ext_out) -> dst path string.
+
+    - Replace originals: write a temp file next to each source, then swap in-place (original kept as .bak)
+    - Same folder: '<stem>_432<ext>' next to the source
+    - Folder mode: preserve relative subfolder structure under dst_base
+    - Single-file mode: place into dst_base
+
+    Works on plain strings: this runs once per file and pathlib arithmetic costs several
+    PurePath constructions per call.
+    """
+    join, dirname = os.path.join, os.path.dirname
+    if cfg.replace_original:
+        return lambda f, stem, ext: join(dirname(f), f"{stem}.__tmp432__{ext}")
+    if cfg.same_folder:
+        return lambda f, stem, ext: join(dirname(f), f"{stem}_432{ext}")
+    dst_base = str(cfg.dst_base)
+    if cfg.src_is_dir:
+        src = str(cfg.src)
+        prefix = src.rstrip(os.sep) + os.sep
+
+        def _mirrored(f: str, stem: str, ext: str) -> str:
+            # Scanned paths are built from str(src), so the relative part is a plain slice.
+            parent = dirname(f)
+            if parent.startswith(prefix):
+                rel = parent[len(prefix):]
+            elif parent == src:
+                rel = ""
+            else:
+                rel = os.path.relpath(parent, src)
+            return join(dst_base, rel, f"{stem}_432{ext}")
+
+        return _mirrored
+    return lambda f, stem, ext: join(dst_base, f"{stem}_432{ext}")
+
+
+def _plan_probe(f_path: Path, cfg: _RunConfig) -> Tuple[bool, bool, bool, Optional[int], Optional[int]]:
+    """Probe *f_path* the way _plan_job needs it for this run."""
+    # In-place replacement keeps the extension, so audio-only files need no video-stream probe.
+    return (_probe_audio_only if cfg.replace_original else _probe_media_info)(f_path)
+
+
+def _plan_job(f_path: Path, cfg: _RunConfig, made_dirs: Optional[set] = None,
+              compute_dst: Optional[Callable[[str, str, str], str]] = None,
+              probe_result: Optional[Tuple[bool, bool, bool, Optional[int], Optional[int]]] = None) -> Optional[ConvertJob]:
+    """Probe *f_path* and work out where its output goes; None means there is nothing to convert.
+
+    *made_dirs* collects output folders (as strings) already created during this run, so a batch
+    writing thousands of files into one folder calls mkdir() once. *compute_dst* is the run's
+    _dst_builder(cfg), chosen once by the caller. *probe_result* is a _plan_probe() answer the
+    caller already has. Raises OSError if the destination folder cannot be created.
+    """
+    if probe_result is None:
+        probe_result = _plan_probe(f_path, cfg)
+    has_audio, has_real_video, has_attached_pic, original_sample_rate, original_bitrate = probe_result
+    if not has_audio:
+        # Shouldn't happen because find_audio_files filters, but be defensive.
+        logging.info(f"Skipping non-audio file after probe: {f_path}")
+        return None
+
+    # Split the name once with os.path; Path.stem/.suffix re-parse it on every access.
+    f_str = str(f_path)
+    stem, suffix = os.path.splitext(os.path.basename(f_str))
+    if suffix == ".":
+        # pathlib treats a trailing dot as part of the stem; keep names identical to before.
+        stem, suffix = stem + suffix, ""
+    ext_out = _choose_output_ext(suffix, has_real_video)
+
+    if cfg.replace_original:
+        # Keep the same container/extension when replacing originals.
+        ext_out = suffix
+    dst_str = (compute_dst or _dst_builder(cfg))(f_str, stem, ext_out)
+
+    parent = os.path.dirname(dst_str) or "."
+    if made_dirs is None or parent not in made_dirs:
+        os.makedirs(parent, exist_ok=True)
+        if made_dirs is not None:
+            made_dirs.add(parent)
+
+    if cfg.skip_existing:
+        if cfg.existing_sizes is not None and dst_str.startswith(os.path.join(str(cfg.dst_base), "")):
+            existing_size = cfg.existing_sizes.get(dst_str, 0)
+        else:
+            try:
+                existing_size = os.stat(dst_str).st_size
+            except OSError:
+                existing_size = 0
+        if existing_size > 0:
+            logging.info(f"Skipping existing file: {dst_str}")
+            return None
+
+    # CORRECTED: Pass the original sample rate to the conversion function.
+    return ConvertJob(
+        f_path,
+        Path(dst_str),
+        int(original_sample_rate) if original_sample_rate else 44100,
+        cfg.target_sr,
+        original_bitrate,
+        has_real_video=has_real_video,
+        has_attached_pic=has_attached_pic,
+    )
+
+
+def _discard_temp(dst_file: Path) -> None:
+    """Remove a leftover in-place replacement temp file ('*.__tmp432__.*'), ignoring errors."""
+    if '.__tmp432__' in dst_file.name:
+        try:
+            dst_file.unlink(missing_ok=True)
+        except Exception:
+            pass
+
+
+def _finish_job(job: ConvertJob, cfg: _RunConfig) -> None:
+    """After a successful conversion: swap the temp output over the original when replacing originals."""
+    if not cfg.replace_original:
+        return
+    # Raises (after removing the temp file) if the swap fails.
+    if _replace_original_with_backup(job.src, job.dst, backup=cfg.keep_backup):
+        logging.info(f"Replaced original with 432Hz version ({'backup created' if cfg.keep_backup else 'no backup'}): {job.src.name}")
+
+
 # =============================================================================
 # 3.  GUI and Drag‑and‑drop
 # =============================================================================
@@ -764,7 +1462,10 @@ try:
 except (ModuleNotFoundError, ImportError):
     _tk = _filedialog = _messagebox = _ttk = None
 
-if _tk is not None:
+# Decided once at import; the GUI class below only exists when this is True.
+_GUI_AVAILABLE = _tk is not None and _messagebox is not None and _filedialog is not None and _ttk is not None
+
+if _GUI_AVAILABLE:
     try:
         from tkinterdnd2 import DND_FILES as _DND_FILES, TkinterDnD as _TkDnD
     except (ModuleNotFoundError, ImportError):
@@ -775,21 +1476,49 @@ else:
     _DND_FILES = "Files"
 
 
+@functools.lru_cache(maxsize=256)
+def _path_exists_cached(s: str, bucket: int) -> bool:
+    """Path(s).exists(), memoized per ~2 s *bucket* so bursts of duplicate drop events share one stat."""
+    return Path(s).exists()
+
+
 def _parse_drop_data(data: str) -> Optional[Path]:
     if not data: return None
     s = data.strip()
     if s.startswith("{") and s.endswith("}") and len(s) > 1: s = s[1:-1].strip()
     if not s: return None
     if '\n' in s: s = s.split('\n')[0].strip()
-    if not Path(s).exists():
+    if not _path_exists_cached(s, int(time.monotonic() // 2)):
         logging.warning(f"Parsed drop data '{s}' does not exist as a path.")
         return None
     return Path(s)
 
 
-if _tk is not None and _messagebox is not None and _filedialog is not None and _ttk is not None:
+@dataclass(frozen=True)
+class _GuiArgs:
+    """Command-line options the GUI pre-fills, normalized once from the argparse namespace."""
+    folder: Optional[Path] = None
+    outdir: Optional[Path] = None
+    recursive: bool = False
+    keep: bool = False
+    replace_original: bool = False
+    no_backup: bool = False
+
+    @classmethod
+    def from_namespace(cls, ns: argparse.Namespace) -> "_GuiArgs":
+        return cls(
+            folder=getattr(ns, "folder", None),
+            outdir=getattr(ns, "outdir", None),
+            recursive=getattr(ns, "recursive", False),
+            keep=getattr(ns, "keep", False),
+            replace_original=getattr(ns, "replace_original", False),
+            no_backup=getattr(ns, "no_backup", False),
+        )
+
+
+if _GUI_AVAILABLE:
     class _ConverterGUI:
-        def __init__(self, root: "_tk.Tk", args: argparse.Namespace) -> None:
+        def __init__(self, root: "_tk.Tk", args: _GuiArgs) -> None:
             self.root = root
             self.args = args
             root.title("Batch 432 Hz Converter")
@@ -797,6 +1526,14 @@ if _tk is not None and _messagebox is not None and _filedialog is not None and _
             self.src: Optional[Path] = None
             self.dst_base: Optional[Path] = None
             self.thread: Optional[threading.Thread] = None
+            # Progress shared with the worker threads; _poll copies it into the widgets every tick
+            # instead of the workers scheduling a Tk callback per file.
+            self._progress_lock = threading.Lock()
+            self._found = 0
+            self._done = 0
+            self._audio = 0
+            self._errors: List[Tuple[str, str]] = []  # (file name, error text)
+            self._partial: dict[Path, float] = {}  # completed fraction of conversions in flight
             self._build()
             self._apply_initial_args()
 
@@ -828,10 +1565,12 @@ if _tk is not None and _messagebox is not None and _filedialog is not None and _
             self.rec = _tk.BooleanVar(value=True)  # default ON (batch folders usually contain subfolders)
             self.keep = _tk.BooleanVar(value=self.args.keep)
             self.same_folder = _tk.BooleanVar(value=False)  # default OFF (A: output to *_432Hz)
-            self.replace_original = _tk.BooleanVar(value=getattr(self.args, 'replace_original', False))  # replace originals (creates .bak)
+            self.replace_original = _tk.BooleanVar(value=self.args.replace_original)  # replace originals (creates .bak)
             _ttk.Checkbutton(f_opt, text="Recursive", variable=self.rec).pack(side="left")
             _ttk.Checkbutton(f_opt, text="Output in same folder", variable=self.same_folder, command=self._auto_set_output).pack(side="left", padx=(10, 0))
-            _ttk.Checkbutton(f_opt, text="Replace originals (.bak)", variable=self.replace_original, command=self._auto_set_output).pack(side="left", padx=(10, 0))
+            self.keep_backup = _tk.BooleanVar(value=not self.args.no_backup)
+            _ttk.Checkbutton(f_opt, text="Replace originals", variable=self.replace_original, command=self._auto_set_output).pack(side="left", padx=(10, 0))
+            _ttk.Checkbutton(f_opt, text="Keep .bak", variable=self.keep_backup).pack(side="left", padx=(4, 0))
             _ttk.Checkbutton(f_opt, text="Skip existing", variable=self.keep).pack(side="left", padx=(10, 0))
 
             self.bar = _ttk.Progressbar(self.root, length=420, mode="determinate")
@@ -875,15 +1614,23 @@ if _tk is not None and _messagebox is not None and _filedialog is not None and _
             if p:
                 self._set_src(p)
 
+        # StringVar.set() fires Tk traces and redraws the entry even for an identical value
+        # (duplicate drop events, checkbox toggles recomputing the same folder), so compare first.
         def _set_src(self, p: Path):
             self.src = p.resolve()
-            self.var_src.set(str(self.src))
+            s = str(self.src)
+            if s != self.var_src.get():
+                self.var_src.set(s)
             # Always auto-update output when source changes (as requested)
             self._auto_set_output()
 
         def _set_out(self, p: Path):
+            if p == self.dst_base and str(p) == self.var_out.get():
+                return
             self.dst_base = p.resolve()
-            self.var_out.set(str(self.dst_base))
+            s = str(self.dst_base)
+            if s != self.var_out.get():
+                self.var_out.set(s)
 
         def _auto_set_output(self):
             """Auto-set output folder based on current source and the 'Output in same folder' checkbox."""
@@ -932,124 +1679,179 @@ if _tk is not None and _messagebox is not None and _filedialog is not None and _
                     return
 
             self.btn.config(state="disabled")
-            self.bar["value"] = 0
+            self.bar.config(value=0, maximum=0)
+            self._found = self._done = self._audio = 0
+            self._errors = []
+            self._partial = {}
             self.thread = threading.Thread(target=self._worker, daemon=True)
             self.thread.start()
             self._poll()
 
         def _poll(self):
+            with self._progress_lock:
+                found, done, audio, errors = self._found, self._done, self._audio, list(self._errors)
+                in_flight = sum(self._partial.values())
+            self.bar.config(maximum=found, value=done + in_flight)
             if self.thread and self.thread.is_alive():
                 self.root.after(200, self._poll)
-            else:
-                self.btn.config(state="normal")
-                if self.bar["value"] == self.bar["maximum"] and self.bar["maximum"] > 0:
-                    _messagebox.showinfo("Done", f"Conversion complete!\nFiles are in: {self.dst_base}")
-                self.bar["value"] = 0
-
-        def _worker(self):
-            assert self.src and self.dst_base, "Source or destination not set"
-            files = [self.src] if (self.src and self.src.is_file()) else find_audio_files(self.src, self.rec.get())
-            total = len(files)
-            if not total:
-                self.root.after(0, lambda: _messagebox.showinfo("Info", "No media files with audio were found in the selected folder."))
                 return
 
-            self.bar.config(maximum=total)
-            errors_occurred = False
-            for idx, f_path in enumerate(files, 1):
-                self.root.after(0, lambda i=idx: self.bar.config(value=i))
+            self.btn.config(state="normal")
+            self.bar.config(value=0)
+            if errors:
+                self._show_errors(errors)
+            elif not audio:
+                _messagebox.showinfo("Info", "No media files with audio were found in the selected folder.")
+            elif done == found:
+                _messagebox.showinfo("Done", f"Conversion complete!\nFiles are in: {self.dst_base}")
+
+        def _show_errors(self, errors: List[Tuple[str, str]]) -> None:
+            """One scrollable window listing every failed file, instead of a dialog per error."""
+            win = _tk.Toplevel(self.root)
+            win.title("Conversion errors")
+            win.transient(self.root)
+            _ttk.Label(win, text=f"{len(errors)} file(s) had errors (details are also in app_converter.log):").pack(
+                anchor="w", padx=10, pady=(10, 5))
+            f_text = _ttk.Frame(win)
+            f_text.pack(fill="both", expand=True, padx=10)
+            text = _tk.Text(f_text, width=90, height=20, wrap="word")
+            scroll = _ttk.Scrollbar(f_text, orient="vertical", command=text.yview)
+            text.configure(yscrollcommand=scroll.set)
+            text.pack(side="left", fill="both", expand=True)
+            scroll.pack(side="left", fill="y")
+            text.insert("end", "\n\n".join(f"{name}\n{msg}" for name, msg in errors))
+            text.configure(state="disabled")
+            _ttk.Button(win, text="Close", command=win.destroy).pack(pady=10)
 
-                has_audio, has_real_video, has_attached_pic, original_sample_rate, original_bitrate = _probe_media_info(f_path)
-                if not has_audio:
-                    # Shouldn't happen because find_audio_files filters, but be defensive.
-                    logging.info(f"Skipping non-audio file after probe: {f_path}")
-                    continue
+        def _worker(self):
+            assert self.src and self.dst_base, "Source or destination not set"
+            # Scan in a producer thread and start converting as soon as the first file turns up;
+            # the progress bar maximum grows as files are discovered.
+            found: "queue.Queue[Optional[Path]]" = queue.Queue(maxsize=256)
+            recursive = self.rec.get()
 
-                ext_out = _choose_output_ext(f_path.suffix, has_real_video)
-
-                # Compute destination path:
-                # - Replace originals: write a temp file next to each source, then swap in-place (original kept as .bak)
-                # - Folder mode: preserve relative subfolder structure under dst_base
-                # - Single-file mode: place into dst_base (or next to source when same_folder=True)
-                if self.replace_original.get():
-                    # Keep the same container/extension when replacing originals.
-                    ext_out = f_path.suffix
-                    dst_file = f_path.with_name(f"{f_path.stem}.__tmp432__{ext_out}")
-                elif self.src and self.src.is_dir():
-                    rel_path = f_path.relative_to(self.src)
-                    if self.same_folder.get():
-                        dst_file = f_path.parent / f"{f_path.stem}_432{ext_out}"
+            def _scan() -> None:
+                try:
+                    files = [self.src] if self.src.is_file() else iter_audio_files(self.src, recursive)
+                    for f_path in files:
+                        found.put(f_path)
+                        with self._progress_lock:
+                            self._found += 1
+                except Exception as e:
+                    logging.error(f"GUI Worker: Error scanning {self.src}: {e}", exc_info=True)
+                finally:
+                    found.put(None)
+
+            threading.Thread(target=_scan, daemon=True).start()
+
+            # Snapshot the options once; planning and conversions run on pool threads.
+            cfg = _RunConfig(
+                src=self.src,
+                dst_base=self.dst_base,
+                src_is_dir=self.src.is_dir(),
+                replace_original=self.replace_original.get(),
+                keep_backup=self.keep_backup.get(),
+                same_folder=self.same_folder.get(),
+                skip_existing=self.keep.get(),
+            )
+            if cfg.skip_existing and not cfg.replace_original:
+                # One walk of the output tree instead of exists()+stat() per file.
+                cfg = cfg._replace(existing_sizes=_scan_file_sizes(cfg.dst_base))
+
+            made_dirs: set = set()  # output folders created during this run
+            compute_dst = _dst_builder(cfg)
+
+            def _advance(error: Optional[Tuple[str, str]] = None) -> None:
+                with self._progress_lock:
+                    self._done += 1
+                    if error is not None:
+                        self._errors.append(error)
+
+            def _plan(f_path: Path) -> Tuple[Path, Optional[ConvertJob], Optional[Exception]]:
+                # Scanned candidates are not probed yet; non-audio files are simply counted as done.
+                # Every failure comes back as a result, so each scanned file is counted exactly once.
+                try:
+                    probe_result = _plan_probe(f_path, cfg)
+                    if not probe_result[0]:
+                        return f_path, None, None
+                    with self._progress_lock:
+                        self._audio += 1
+                    return f_path, _plan_job(f_path, cfg, made_dirs, compute_dst, probe_result), None
+                except Exception as e:  # mostly OSError from creating the output folder
+                    return f_path, None, e
+
+            # Pipeline: scan thread -> `found` -> probe/plan threads -> `planned` -> convert_many.
+            # ffprobe for upcoming files overlaps with ffmpeg for earlier ones; None marks end-of-stream.
+            planned: "queue.Queue[Optional[Tuple[Path, Optional[ConvertJob], Optional[Exception]]]]" = queue.Queue()
+
+            def _plan_stage() -> None:
+                try:
+                    while (f_path := found.get()) is not None:
+                        planned.put(_plan(f_path))
+                    found.put(None)  # let the other plan threads see the end as well
+                finally:
+                    planned.put(None)
+
+            for _ in range(_PLAN_WORKERS):
+                threading.Thread(target=_plan_stage, daemon=True).start()
+
+            def _planned_results():
+                open_stages = _PLAN_WORKERS
+                while open_stages:
+                    item = planned.get()
+                    if item is None:
+                        open_stages -= 1
                     else:
-                        dst_file = self.dst_base / rel_path.with_name(f"{f_path.stem}_432{ext_out}")
-                else:
-                    rel_path = Path(f_path.name)
-                    if self.same_folder.get():
-                        dst_file = f_path.parent / f"{f_path.stem}_432{ext_out}"
+                        yield item
+
+            # Destinations already handed to convert_many; e.g. 'a.wma' and 'a.mp3' both map to
+            # 'a_432.mp3' in same-folder mode, and two ffmpeg processes must not write one file.
+            # Only _jobs() touches it (from the single thread feeding convert_many), so no lock.
+            claimed_dsts: set = set()
+
+            def _jobs(planned_items):
+                for f_path, job, error in planned_items:
+                    if error is not None:
+                        logging.error(f"GUI Worker: Could not prepare output for {f_path.name}: {error}", exc_info=error)
+                        _advance(error=(f_path.name, f"Could not prepare output: {error}"))
+                    elif job is None:
+                        _advance()
                     else:
-                        dst_file = self.dst_base / rel_path.with_name(f"{f_path.stem}_432{ext_out}")
-
-                try:
-                    dst_file.parent.mkdir(parents=True, exist_ok=True)
-                except OSError as e:
-                    logging.error(f"GUI Worker: Error creating directory for {dst_file.name}: {e}", exc_info=True)
-                    self.root.after(0, lambda f=dst_file.name, m=e: _messagebox.showerror("File Error",
-                                                                                          f"Could not create directory for:\n{f}\n\n{m}"))
-                    errors_occurred = True
-                    continue
+                        dst_key = os.path.normcase(str(job.dst))
+                        if dst_key in claimed_dsts:
+                            logging.warning(f"GUI Worker: Skipping {f_path}: {job.dst} is already written by another file in this run")
+                            _advance(error=(f_path.name, f"Skipped: {job.dst.name} is already written by another file in this run"))
+                            continue
+                        claimed_dsts.add(dst_key)
+                        yield job
+
+            def _on_progress(job: ConvertJob, fraction: float) -> None:
+                with self._progress_lock:
+                    self._partial[job.src] = fraction
+
+            def _on_done(job: ConvertJob, error: Optional[BaseException]) -> None:
+                f_path, dst_file = job.src, job.dst
+                with self._progress_lock:
+                    self._partial.pop(f_path, None)
+                if error is None:
+                    try:
+                        _finish_job(job, cfg)
+                    except Exception as e:
+                        error = e
 
-                if self.keep.get() and dst_file.exists() and dst_file.stat().st_size > 0:
-                    logging.info(f"GUI Worker: Skipping existing file: {dst_file}")
-                    continue
+                message = None
+                if isinstance(error, subprocess.CalledProcessError):
+                    _discard_temp(dst_file)
+                    logging.error(f"GUI Worker: Conversion failed for {f_path.name}: {error.stderr}", exc_info=False)
+                    message = (f_path.name, f"Failed to convert:\n{error.stderr}")
+                elif error is not None:
+                    _discard_temp(dst_file)
+                    logging.error(f"GUI Worker: Unexpected error converting {f_path.name}: {error}", exc_info=error)
+                    message = (f_path.name, f"Unexpected error: {error}")
+                _advance(error=message)
 
-                target_sample_rate = 48000
-                try:
-                    # CORRECTED: Pass the original sample rate to the conversion function.
-                    convert_to_432(
-                        f_path,
-                        dst_file,
-                        int(original_sample_rate) if original_sample_rate else 44100,
-                        target_sample_rate,
-                        original_bitrate,
-                        has_real_video=has_real_video,
-                        has_attached_pic=has_attached_pic,
-                    )
-                    if self.replace_original.get():
-                        try:
-                            _replace_original_with_backup(f_path, dst_file)
-                            logging.info(f"Replaced original with 432Hz version (backup created): {f_path.name}")
-                        finally:
-                            # If something went wrong and temp still exists, clean it up.
-                            if dst_file.exists() and dst_file.name.find('.__tmp432__') != -1:
-                                try:
-                                    dst_file.unlink(missing_ok=True)
-                                except Exception:
-                                    pass
-
-                except subprocess.CalledProcessError as e_conv:
-                    if self.replace_original.get() and '.__tmp432__' in dst_file.name:
-                        try:
-                            dst_file.unlink(missing_ok=True)
-                        except Exception:
-                            pass
-                    logging.error(f"GUI Worker: Conversion failed for {f_path.name}: {e_conv.stderr}", exc_info=False)
-                    self.root.after(0,
-                                    lambda p=f_path.name, err=e_conv.stderr: _messagebox.showerror("Conversion Error",
-                                                                                                   f"Failed to convert:\n{p}\n\nError:\n{err}"))
-                    errors_occurred = True
-                except Exception as e_gen:
-                    if self.replace_original.get() and '.__tmp432__' in dst_file.name:
-                        try:
-                            dst_file.unlink(missing_ok=True)
-                        except Exception:
-                            pass
-                    logging.error(f"GUI Worker: Unexpected error converting {f_path.name}: {e_gen}", exc_info=True)
-                    self.root.after(0, lambda p=f_path.name, err=e_gen: _messagebox.showerror("Conversion Error",
-                                                                                              f"Unexpected error converting:\n{p}\n\nError:\n{err}"))
-                    errors_occurred = True
-
-            if errors_occurred:
-                self.root.after(0, lambda: _messagebox.showwarning("Done",
-                                                                   "Conversion finished, but some files had errors. Check log."))
+            # convert_many keeps up to _CONVERT_WORKERS ffmpeg processes busy as planned jobs arrive.
+            convert_many(_jobs(_planned_results()), on_done=_on_done, on_progress=_on_progress)
 
 
 # =============================================================================
@@ -1064,6 +1866,8 @@ def _build_parser() -> argparse.ArgumentParser:
     p.add_argument("--keep", action="store_true", help="Pre-select skipping existing files in GUI.")
     p.add_argument("--replace", dest="replace_original", action="store_true",
                    help="Pre-select replacing originals (creates .bak backups) in GUI.")
+    p.add_argument("--no-backup", dest="no_backup", action="store_true",
+                   help="Pre-select overwriting originals without keeping .bak backups (with --replace).")
     p.add_argument("--ffmpeg", dest="ffmpeg_path", type=Path,
                    help="Path to ffmpeg folder/executable for FFmpeg/FFprobe resolution.")
     p.add_argument("--out", dest="outdir", type=Path, help="Optional: Destination base folder to pre-fill in GUI.")
@@ -1071,21 +1875,200 @@ def _build_parser() -> argparse.ArgumentParser:
     return p
 
 
-class _Tests(unittest.TestCase):
-    def test_codec_quality(self):
-        self.assertIn("-b:a", _codec_for_ext(".mp3"))
-        self.assertIn("512k", _codec_for_ext(".aac"))
-        self.assertTrue(_codec_for_ext(".wma"))
-        self.assertTrue(_codec_for_ext(".wma", safe=True))
-
-    def test_parse_drop_data(self):
-        Path("./tmp_test_dir").mkdir(exist_ok=True)
-        self.assertEqual(_parse_drop_data("{./tmp_test_dir}"), Path("./tmp_test_dir"))
-        Path("./tmp_test_dir").rmdir()
+# The frozen EXE is built with --exclude-module=unittest; self-tests are a dev-only feature.
+try:
+    import unittest
+except ImportError:
+    unittest = None
+
+if unittest is not None:
+    class _Tests(unittest.TestCase):
+        def test_codec_quality(self):
+            self.assertIn("-b:a", _codec_for_ext(".mp3"))
+            self.assertIn("512k", _codec_for_ext(".aac"))
+            self.assertTrue(_codec_for_ext(".wma"))
+            self.assertTrue(_codec_for_ext(".wma", safe=True))
+
+        def test_parse_drop_data(self):
+            import tempfile
+            with tempfile.TemporaryDirectory() as d:
+                self.assertEqual(_parse_drop_data("{" + d + "}"), Path(d))
+
+        def test_drain_tail_keeps_only_tail(self):
+            import io
+            data = b"".join(b"frame %06d some ffmpeg chatter\n" % i for i in range(10000))
+            self.assertGreater(len(data), 4 * _STDERR_RING_BYTES)
+            for on_line in (None, lambda ln: False):
+                ring: deque = deque()
+                _drain_tail(io.BytesIO(data), ring, on_line)
+                kept = b"".join(ring)
+                self.assertLess(len(kept), len(data))
+                self.assertGreaterEqual(len(kept), _STDERR_RING_BYTES)
+                self.assertTrue(data.endswith(kept))
+                self.assertEqual(kept.splitlines()[-1], b"frame 009999 some ffmpeg chatter")
+
+        def test_progress_lines_report_fractions_and_keep_errors(self):
+            import io
+
+            class _Trickle(io.BytesIO):  # short reads split lines (and '\r\n') across chunks
+                def read1(self, n=-1):
+                    return super().read1(7)
+
+            data = (b"  Duration: 00:00:10.00, start: 0.000000, bitrate: 128 kb/s\r\n"
+                    b"frame=12\nout_time_us=2500000\nout_time_ms=2500000\nprogress=continue\n"
+                    b"out_time_us=5000000\r\nbitrate=128.0kbits/s\rout_time_us=7500000\r"
+                    b"[mp3 @ 0x1] Invalid data found when processing input\r\n"
+                    b"Error while decoding stream #0:0: Invalid argument\n"
+                    b"out_time_us=99000000\nprogress=end")
+            for stream in (io.BytesIO(data), _Trickle(data)):
+                fractions: List[float] = []
+                ring: deque = deque()
+                _drain_tail(stream, ring, _progress_line_handler(fractions.append))
+                self.assertEqual(fractions, [0.25, 0.5, 0.75, 1.0])
+                self.assertEqual(b"".join(ring).splitlines(), [
+                    b"  Duration: 00:00:10.00, start: 0.000000, bitrate: 128 kb/s",
+                    b"[mp3 @ 0x1] Invalid data found when processing input",
+                    b"Error while decoding stream #0:0: Invalid argument",
+                ])
+
+        def test_plan_job_destinations_match_pathlib_rules(self):
+            import tempfile
+            audio = (True, False, False, 44100, None)
+            with tempfile.TemporaryDirectory() as d:
+                src, out = Path(d) / "lib", Path(d) / "out"
+                files = [src / "a.mp3", src / "sub" / "deeper" / "b.c.WMA", src / "sub" / "noext", src / "x."]
+                base = _RunConfig(src=src, dst_base=out, src_is_dir=True, replace_original=False,
+                                  keep_backup=True, same_folder=False, skip_existing=False)
+                for f in files:
+                    ext = _choose_output_ext(f.suffix, False)
+                    expected = {
+                        "folder": (base, out / f.parent.relative_to(src) / f"{f.stem}_432{ext}"),
+                        "same_folder": (base._replace(same_folder=True), f.parent / f"{f.stem}_432{ext}"),
+                        "replace": (base._replace(replace_original=True), f.with_name(f"{f.stem}.__tmp432__{f.suffix}")),
+                        "single_file": (base._replace(src=f, src_is_dir=False), out / f"{f.stem}_432{ext}"),
+                    }
+                    for mode, (cfg, dst) in expected.items():
+                        with self.subTest(file=f.name, mode=mode):
+                            job = _plan_job(f, cfg, set(), _dst_builder(cfg), probe_result=audio)
+                            self.assertEqual(job.dst, dst)
+                            self.assertTrue(dst.parent.is_dir())
+
+        def test_progress_arrives_while_child_runs(self):
+            child = (
+                "import sys, time\n"
+                "sys.stderr.write('  Duration: 00:00:04.00, start: 0.000000\\n'); sys.stderr.flush()\n"
+                "for i in range(1, 5):\n"
+                "    time.sleep(0.3)\n"
+                "    sys.stderr.write('out_time_us=%d000000\\nprogress=continue\\n' % i); sys.stderr.flush()\n"
+            )
+            arrivals: List[Tuple[float, float]] = []
+            start = time.monotonic()
+            on_line = _progress_line_handler(lambda f: arrivals.append((f, time.monotonic() - start)))
+            proc = _popen_run([sys.executable, "-c", child], tail_only=True, on_stderr_line=on_line)
+            elapsed = time.monotonic() - start
+            self.assertEqual(proc.returncode, 0)
+            self.assertEqual([f for f, _ in arrivals], [0.25, 0.5, 0.75, 1.0])
+            # The first update must not wait for the child to exit (~1.2 s of sleeps).
+            self.assertLess(arrivals[0][1], elapsed - 0.5)
+
+        def test_download_retries_server_errors_only(self):
+            import http.server
+            import tempfile
+            import urllib.error
+            from unittest import mock
+
+            statuses: List[int] = []
+
+            class _Handler(http.server.BaseHTTPRequestHandler):
+                def do_GET(self):
+                    code = statuses.pop(0)
+                    body = b"payload" if code == 200 else b""
+                    self.send_response(code)
+                    self.send_header("Content-Length", str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+
+                def log_message(self, *args):
+                    pass
+
+            server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+            url = f"http://127.0.0.1:{server.server_port}/ffmpeg.zip"
+            try:
+                with tempfile.TemporaryDirectory() as d, mock.patch("time.sleep") as sleep:
+                    statuses[:] = [503, 429, 200]
+                    _download_resumable(url, Path(d) / "a.zip")
+                    self.assertEqual((Path(d) / "a.zip").read_bytes(), b"payload")
+                    self.assertEqual(sleep.call_count, 2)
+
+                    statuses[:] = [404, 200]
+                    with self.assertRaises(urllib.error.HTTPError):
+                        _download_resumable(url, Path(d) / "b.zip")
+                    self.assertEqual(statuses, [200])
+                    self.assertEqual(sleep.call_count, 2)
+            finally:
+                server.shutdown()
+                server.server_close()
+
+        def test_replace_never_overwrites_existing_backup(self):
+            import tempfile
+            with tempfile.TemporaryDirectory() as d:
+                original, new_file = Path(d) / "a.mp3", Path(d) / "a.__tmp432__.mp3"
+                original.write_bytes(b"original")
+                (Path(d) / "a.mp3.bak").write_bytes(b"older backup")
+                new_file.write_bytes(b"converted")
+                self.assertTrue(_replace_original_with_backup(original, new_file))
+                self.assertEqual(original.read_bytes(), b"converted")
+                self.assertEqual((Path(d) / "a.mp3.bak").read_bytes(), b"older backup")
+                backups = [p for p in Path(d).glob("a.mp3.*.bak")]
+                self.assertEqual(len(backups), 1)
+                self.assertEqual(backups[0].read_bytes(), b"original")
+                self.assertFalse(new_file.exists())
+
+        def test_replace_restores_original_on_failure(self):
+            import tempfile
+            with tempfile.TemporaryDirectory() as d:
+                original = Path(d) / "a.mp3"
+                original.write_bytes(b"original")
+                missing_new = Path(d) / "a.__tmp432__.mp3"  # final os.replace() fails
+                with self.assertRaises(OSError):
+                    _replace_original_with_backup(original, missing_new)
+                self.assertEqual(original.read_bytes(), b"original")
+                self.assertEqual(sorted(p.name for p in Path(d).iterdir()), ["a.mp3"])
+
+        def test_bitrate_slot_for_every_codec_entry(self):
+            for table in (HQ_CODEC, SAFE_CODEC):
+                for ext, opts in table.items():
+                    with self.subTest(ext=ext, safe=table is SAFE_CODEC):
+                        opts = tuple(opts)
+                        idx, target_bps = _bitrate_slot(opts)
+                        self.assertEqual(_adjust_bitrate_in_options(opts, None, "x"), list(opts))
+                        if "-b:a" not in opts:
+                            self.assertEqual((idx, target_bps), (None, -1))
+                            self.assertEqual(_adjust_bitrate_in_options(opts, 8000, "x"), list(opts))
+                            continue
+                        self.assertEqual(opts[idx - 1], "-b:a")
+                        self.assertEqual(target_bps, int(opts[idx][:-1]) * 1000)
+                        self.assertEqual(_adjust_bitrate_in_options(opts, target_bps, "x"), list(opts))
+                        capped = _adjust_bitrate_in_options(opts, 96000, "x")
+                        self.assertEqual(capped[idx], "96k")
+                        self.assertEqual(capped[:idx] + capped[idx + 1:], list(opts[:idx] + opts[idx + 1:]))
+
+        def test_failed_ffprobe_is_not_persisted(self):
+            from unittest import mock
+            failed = PopenResult([], 1, b"{}", b"")
+            with mock.patch(f"{__name__}._popen_run", return_value=failed), \
+                    mock.patch(f"{__name__}._probe_cache_get", return_value=None), \
+                    mock.patch(f"{__name__}._probe_cache_put") as put:
+                self.assertFalse(_probe_media_info_uncached(Path("locked.mp3"), (1, 1))[0])
+                put.assert_not_called()
 
 
 def _run_tests():
     logging.info("Running self-tests...")
+    if unittest is None:
+        logging.critical("unittest is not available in this build; run the self-tests from source.")
+        sys.exit(1)
     try:
         _resolve_ffmpeg(None)
     except SystemExit:
@@ -1115,13 +2098,13 @@ def main():
     try:
         _resolve_ffmpeg(args.ffmpeg_path)
     except SystemExit:
-        if _tk and _messagebox:
+        if _GUI_AVAILABLE:
             _messagebox.showerror("FFmpeg Error", "FFmpeg/FFprobe not found. Please see app_converter.log for details.")
         else:
             print("CRITICAL: FFmpeg/FFprobe not found. Check log.", file=sys.stderr)
         sys.exit(1)
 
-    if _tk is None:
+    if not _GUI_AVAILABLE:
         logging.critical("Tkinter components not available. GUI cannot run.")
         print("CRITICAL ERROR: Tkinter is not installed or not working correctly.", file=sys.stderr)
         sys.exit(1)
@@ -1140,7 +2123,7 @@ def main():
 
     if root_tk_instance:
         logging.info("Starting GUI.")
-        _ConverterGUI(root_tk_instance, args)
+        _ConverterGUI(root_tk_instance, _GuiArgs.from_namespace(args))
         root_tk_instance.mainloop()
         logging.info("GUI mainloop finished.")
 